@@ -0,0 +1,84 @@
+"""Compara estratégias de carregamento na listagem de usuários.
+
+Executa `User.query_params` com `user_role` carregado via JOIN (estratégia antiga
+do mapeamento) e via `selectinload` (padrão atual para coleções), medindo o número
+de comandos, as linhas devolvidas pelo banco e a latência de cada uma.
+
+Uso:
+    python benchmarks/user_listing.py --limit 100 --repeat 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlalchemy import event
+
+import db
+import models
+
+STRATEGIES = ("joined", "selectin", "noload")
+
+
+def measure(strategy: str, limit: int, repeat: int) -> dict:
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        models.User.query_params(
+            all_data=True, skip=0, limit=limit, load={"user_role": strategy}
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    rows = 0
+    with db.engine.connect() as conn:
+        for statement, parameters in statements:
+            cursor = conn.connection.cursor()
+            cursor.execute(statement, parameters)
+            rows += len(cursor.fetchall())
+            cursor.close()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        models.User.query_params(
+            all_data=True, skip=0, limit=limit, load={"user_role": strategy}
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "statements": len(statements),
+        "rows": rows,
+        "median_ms": statistics.median(timings),
+        "p95_ms": sorted(timings)[int(len(timings) * 0.95) - 1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'estratégia':<10} {'comandos':>9} {'linhas':>8} "
+        f"{'mediana (ms)':>13} {'p95 (ms)':>9}"
+    )
+    for strategy in STRATEGIES:
+        result = measure(strategy, args.limit, args.repeat)
+        print(
+            f"{strategy:<10} {result['statements']:>9} {result['rows']:>8} "
+            f"{result['median_ms']:>13.2f} {result['p95_ms']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import streamlit as st
 from pages import UserManagement, RoleManagement
+import services.bootstrap  # noqa: F401 (inicia os serviços em segundo plano)
 
 
 
@@ -1,15 +1,23 @@
 import datetime
 import logging
+import time
 from typing import Optional, Union
 
 import jwt
 from requests import Request
 
 
-import core, error, models
+import core, error, models, util
 
 __all__ = ["Key", "encode_token", "decode_token"]
 
+# Tokens já verificados (assinatura e usuário ativo). Limpo a cada escrita na
+# tabela de usuários, o que inclui a desativação via Base.update.
+_token_cache = util.TTLCache(
+    core.settings.AUTH_CACHE_MAX_ENTRIES, core.settings.AUTH_CACHE_TTL_SECONDS
+)
+util.bind_cache(models.User.__tablename__, _token_cache)
+
 
 def encode_token(sub, exp):
     """
@@ -87,17 +95,40 @@ def get_user_from_payload(payload: dict) -> models.User:
     return user
 
 
+def verify_token(token: str) -> dict:
+    """
+    Verifica a assinatura do token e, se houver `user_uuid`, se o usuário está ativo.
+
+    Args:
+        token (str): O token JWT.
+
+    Returns:
+        dict: O payload do token.
+    """
+    try:
+        payload = jwt.decode(token, core.settings.SECRET_KEY, algorithms="HS256")
+    except jwt.ExpiredSignatureError:
+        raise error.CustomException(401, "Desculpe, o token expirou.")
+    except jwt.InvalidTokenError:
+        raise error.CustomException(401, "Desculpe, o token é inválido.")
+    if "user_uuid" in payload["sub"]:
+        user = get_user_from_payload(payload)
+    return payload
+
+
 def decode_token(authorization: str, key: Union[int, None] = None) -> dict:
     try:
         token = validate_token(authorization)
-        try:
-            payload = jwt.decode(token, core.settings.SECRET_KEY, algorithms="HS256")
-        except jwt.ExpiredSignatureError:
-            raise error.CustomException(401, "Desculpe, o token expirou.")
-        except jwt.InvalidTokenError:
-            raise error.CustomException(401, "Desculpe, o token é inválido.")
-        if "user_uuid" in payload["sub"]:
-            user = get_user_from_payload(payload)
+        payload = _token_cache.get(token)
+        if payload is None:
+            payload = verify_token(token)
+            # a entrada não pode sobreviver à expiração do próprio token
+            ttl = min(
+                core.settings.AUTH_CACHE_TTL_SECONDS,
+                payload.get("exp", 0) - time.time(),
+            )
+            if ttl > 0:
+                _token_cache.set(token, payload, ttl)
         if key and key not in payload["sub"].get("key", []):
             raise error.CustomException(401, "Desculpe, você não tem permissão.")
         return payload["sub"]
@@ -1,10 +1,23 @@
 import streamlit as st
 import pandas as pd
 from services import ApiClient
+from components import Tables
+import models, util
+
+
+def load_roles() -> pd.DataFrame:
+    # Em cache; invalidado por ApiClient.create_role e nas escritas de models.Role
+    def query():
+        roles = ApiClient.get_roles()
+        return pd.DataFrame(roles["data"])
+
+    cache = util.get_cache(models.Role.__tablename__)
+    return cache.get_or_set(("RoleTable",), query)
+
 
 def display():
     # Obter dados da API
-    roles = ApiClient.get_roles()
-    df = pd.DataFrame(roles["data"])
+    df = load_roles()
     # Exibir tabela
     st.dataframe(df)
+    Tables.export_button(models.Role, "papeis", "role")
@@ -0,0 +1,41 @@
+import os
+import shutil
+import tempfile
+
+import streamlit as st
+
+__all__ = ["export_button"]
+
+MIME_TYPES = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+
+def export_button(model, file_name: str, key: str) -> None:
+    """Exporta a tabela do modelo em CSV ou Parquet e oferece o download.
+
+    O arquivo é gerado em blocos por `model.export_file` diretamente em disco, e
+    apenas o arquivo pronto é entregue ao botão de download.
+
+    Args:
+        model: Modelo SQLAlchemy derivado de `Base`.
+        file_name (str): Nome do arquivo baixado, sem extensão.
+        key (str): Chave única dos widgets na página.
+    """
+    file_format = st.selectbox(
+        "Formato", list(MIME_TYPES), key=f"{key}_export_format"
+    )
+    if st.button("Exportar", key=f"{key}_export"):
+        # Diretório privado (0700) fora de UPLOAD_DIR: a exportação contém dados
+        # pessoais e não pode ser listada ou servida junto com os uploads.
+        path = tempfile.mkdtemp(prefix="export-")
+        try:
+            filename = model.export_file(f"{path}{os.sep}", file_format)
+            with open(os.path.join(path, filename), "rb") as f:
+                st.download_button(
+                    "Baixar arquivo",
+                    f,
+                    file_name=f"{file_name}.{file_format}",
+                    mime=MIME_TYPES[file_format],
+                    key=f"{key}_download",
+                )
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
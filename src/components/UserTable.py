@@ -1,14 +1,42 @@
 import streamlit as st
 from pydantic import ValidationError
-import pandas as pd
 from services import ApiClient
-import models, schema
+from components import Tables
+import models, schema, util
 from schema import GetUser
 
+
+def load_users(skip: int = 0, limit: int = 100) -> object:
+    # Em cache por página; invalidado nas escritas de models.User
+    def query():
+        # Projeção apenas das colunas de GetUser, sem entidades ORM nem validação por linha
+        columns = models.User.schema_columns(GetUser)
+        result = models.User.query_params(
+            all_data=True,
+            operator="=",
+            skip=skip,
+            limit=limit,
+            window_count=True,
+            include=columns,
+            output="arrow",
+            count_mode="estimate",
+        )
+        # Tabela Arrow tipada: st.dataframe a serializa sem conversão para pandas
+        return result
+
+    cache = util.get_cache(models.User.__tablename__)
+    return cache.get_or_set(("UserTable", skip, limit), query)
+
+
 def display():
     # Obter dados da API
-    query = models.User.query_params(all_data=True, operator="=", skip=0,limit=100)
-    users = [GetUser.model_validate(data).model_dump() for data in query.data]
-    df = pd.DataFrame(users)
+    result = load_users(skip=0, limit=100)
     # Exibir tabela
-    st.dataframe(df)
+    st.dataframe(result.data)
+    st.caption(
+        "Total de usuários: "
+        + util.format_count(
+            result.meta["total_data"], result.meta["approximate"]
+        )
+    )
+    Tables.export_button(models.User, "usuarios", "user")
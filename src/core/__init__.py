@@ -1 +1,2 @@
 from .config import *
+from .security import *
@@ -13,6 +13,21 @@ class Settings(BaseSettings):
     API_URL: str | None = Field(
         None, description="Prefixo da URL da API"
     )
+    API_CONNECT_TIMEOUT: float = Field(
+        3.05, description="Tempo máximo em segundos para conectar à API"
+    )
+    API_READ_TIMEOUT: float = Field(
+        10, description="Tempo máximo em segundos de espera pela resposta da API"
+    )
+    API_RETRIES: int = Field(
+        3, description="Tentativas extras em requisições idempotentes à API"
+    )
+    API_BACKOFF_FACTOR: float = Field(
+        0.3, description="Fator da espera exponencial entre tentativas na API"
+    )
+    API_POOL_SIZE: int = Field(
+        10, description="Conexões keep-alive mantidas com a API"
+    )
     SECRET_KEY: str | None = Field(
         description="Chave secreta para criptografia",
     )
@@ -31,12 +46,91 @@ class Settings(BaseSettings):
     SQLALCHEMY_DATABASE_URI: str | None = Field(
         None, description="URI do banco de dados SQLAlchemy"
     )
+    SQLALCHEMY_ASYNC_DATABASE_URI: str | None = Field(
+        None,
+        description="URI assíncrona do banco (padrão: SQLALCHEMY_DATABASE_URI com asyncpg)",
+    )
+    SQLALCHEMY_REPLICA_URIS: str | None = Field(
+        None,
+        description="URIs das réplicas de leitura, separadas por vírgula",
+    )
+    REPLICA_READ_YOUR_WRITES_SECONDS: float = Field(
+        5,
+        description="Segundos após uma escrita em que a tabela é lida do primário",
+    )
+    REPLICA_RETRY_SECONDS: float = Field(
+        30,
+        description="Segundos em que uma réplica com falha fica fora do rodízio",
+    )
+    DB_POOL_SIZE: int = Field(
+        20, description="Quantidade de conexões mantidas no pool do banco"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        0, description="Conexões extras permitidas além de DB_POOL_SIZE"
+    )
+    DB_POOL_TIMEOUT: float = Field(
+        30, description="Tempo máximo em segundos de espera por uma conexão"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        1800,
+        description="Idade em segundos após a qual a conexão é recriada (-1 desativa)",
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        True, description="Testar a conexão antes de entregá-la do pool"
+    )
+    TOTAL_COUNT_CACHE_SECONDS: int = Field(
+        60, description="Validade em segundos do total de registros em cache"
+    )
+    BULK_BATCH_SIZE: int = Field(
+        1000, description="Quantidade de registros por lote nas operações em massa"
+    )
+    EXPORT_CHUNK_SIZE: int = Field(
+        5000, description="Quantidade de linhas lidas por bloco na exportação"
+    )
+    CACHE_TTL_SECONDS: int = Field(
+        60, description="Validade em segundos dos dados em cache das tabelas"
+    )
+    CACHE_MAX_ENTRIES: int = Field(
+        256, description="Quantidade máxima de consultas em cache por tabela"
+    )
+    AUTH_CACHE_TTL_SECONDS: int = Field(
+        300, description="Validade máxima em segundos de um token verificado em cache"
+    )
+    AUTH_CACHE_MAX_ENTRIES: int = Field(
+        1024, description="Quantidade máxima de tokens verificados em cache"
+    )
+    PASSWORD_HASH_WORKERS: int | None = Field(
+        None,
+        description="Processos do pool de hash de senhas (0 executa no próprio processo, None usa todos os núcleos)",
+    )
     SMTP_TLS: bool | None = Field(None, description="Utilizar TLS para SMTP")
     SMTP_PORT: int | None = Field(None, description="Porta para conexão SMTP")
     SMTP_HOST: str | None = Field(None, description="Host para conexão SMTP")
     SMTP_PASSWORD: str | None = Field(
         None, description="Senha para conexão SMTP"
     )
+    SMTP_POOL_SIZE: int = Field(
+        2, description="Quantidade máxima de conexões SMTP simultâneas"
+    )
+    SMTP_IDLE_SECONDS: float = Field(
+        60,
+        description="Ociosidade em segundos após a qual a conexão SMTP é verificada com NOOP",
+    )
+    EMAIL_OUTBOX_BATCH_SIZE: int = Field(
+        50, description="Emails retirados da fila a cada ciclo do worker"
+    )
+    EMAIL_OUTBOX_CONCURRENCY: int = Field(
+        2, description="Envios simultâneos do worker da fila de emails"
+    )
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = Field(
+        5, description="Tentativas antes de o email ir para a fila morta"
+    )
+    EMAIL_OUTBOX_BACKOFF_SECONDS: float = Field(
+        30, description="Espera base entre tentativas, dobrada a cada falha"
+    )
+    EMAIL_OUTBOX_POLL_SECONDS: float = Field(
+        5, description="Intervalo de consulta da fila de emails quando vazia"
+    )
 
     EMAILS_FROM_EMAIL: str | None = Field(
         None, description="E-mail do remetente"
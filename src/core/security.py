@@ -0,0 +1,113 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import bcrypt
+
+from .config import settings
+
+__all__ = [
+    "get_password_hash",
+    "verify_password",
+    "hash_passwords",
+    "get_password_hash_async",
+    "verify_password_async",
+]
+
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+
+
+def _to_bytes(value: str | bytes) -> bytes:
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+
+def _hash(password: bytes) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt())
+
+
+def _verify(password: bytes, hashed: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed)
+
+
+def _get_executor() -> Executor | None:
+    """Retorna o pool de processos do bcrypt, criado no primeiro uso.
+
+    Com `PASSWORD_HASH_WORKERS=0` o hash é feito no próprio processo.
+    """
+    global _executor
+    if settings.PASSWORD_HASH_WORKERS == 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # spawn: o processo do Streamlit tem várias threads, fork não é seguro
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _run(fn, *args):
+    executor = _get_executor()
+    if executor is None:
+        return fn(*args)
+    return executor.submit(fn, *args).result()
+
+
+async def _run_async(fn, *args):
+    executor = _get_executor()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, fn, *args)
+
+
+def get_password_hash(password: str | bytes) -> bytes:
+    """Gera o hash bcrypt da senha em um processo do pool.
+
+    Args:
+        password (str | bytes): Senha em texto.
+
+    Returns:
+        bytes: Hash da senha.
+    """
+    return _run(_hash, _to_bytes(password))
+
+
+def verify_password(password: str | bytes, hashed: bytes) -> bool:
+    """Verifica a senha contra o hash bcrypt em um processo do pool.
+
+    Args:
+        password (str | bytes): Senha em texto.
+        hashed (bytes): Hash armazenado.
+
+    Returns:
+        bool: True se a senha confere.
+    """
+    return _run(_verify, _to_bytes(password), hashed)
+
+
+def hash_passwords(passwords: list[str | bytes]) -> list[bytes]:
+    """Gera o hash de várias senhas em paralelo, distribuindo entre os processos do pool.
+
+    Args:
+        passwords (list[str | bytes]): Senhas em texto.
+
+    Returns:
+        list[bytes]: Hashes na mesma ordem das senhas.
+    """
+    passwords = [_to_bytes(password) for password in passwords]
+    executor = _get_executor()
+    if executor is None:
+        return [_hash(password) for password in passwords]
+    return list(executor.map(_hash, passwords))
+
+
+async def get_password_hash_async(password: str | bytes) -> bytes:
+    """Versão assíncrona de `get_password_hash`."""
+    return await _run_async(_hash, _to_bytes(password))
+
+
+async def verify_password_async(password: str | bytes, hashed: bytes) -> bool:
+    """Versão assíncrona de `verify_password`."""
+    return await _run_async(_verify, _to_bytes(password), hashed)
@@ -1,27 +1,67 @@
+import base64
+import functools
+import inspect
+import json
 import uuid
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Iterator
 
 from sqlalchemy import (
-    CHAR,
+    DDL,
     Column,
     DateTime,
+    Index,
+    LargeBinary,
     MetaData,
-    String,
     Table,
-    Text,
     column,
+    delete,
+    event,
     func,
+    insert,
+    or_,
     select,
+    tuple_,
+    update,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    joinedload,
+    lazyload,
+    mapped_column,
+    noload,
+    raiseload,
+    selectinload,
+)
 
 import core, error, util
 
-from .session import SessionLocal
+from .counts import (
+    COUNT_MODES,
+    count_generation,
+    count_rows,
+    invalidate_counts,
+    lookup_count,
+    lookup_estimate,
+    store_count,
+)
+from .filters import compile_filter, compile_tree
+from .session import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_engine,
+    connect_replica,
+    current_session,
+    mark_write,
+    on_async_loop,
+)
 
 __all__ = ["Base"]
 
@@ -30,52 +70,316 @@ def generate_uuid():
     return str(uuid.uuid4())
 
 
-type_mapping = {
-    "~": [str],
-    "|": [
-        int,
-        float,
-        lambda x: datetime.strptime(x, "%Y-%m-%d").date(),
-        lambda x: datetime.strptime(x, "%H:%M:%S").time(),
-    ],
-    "<": [
-        int,
-        float,
-        lambda x: datetime.strptime(x, "%Y-%m-%d").date(),
-        lambda x: datetime.strptime(x, "%H:%M:%S").time(),
-    ],
-    ">": [
-        int,
-        float,
-        lambda x: datetime.strptime(x, "%Y-%m-%d").date(),
-        lambda x: datetime.strptime(x, "%H:%M:%S").time(),
-    ],
-    "<=": [
-        int,
-        float,
-        lambda x: datetime.strptime(x, "%Y-%m-%d").date(),
-        lambda x: datetime.strptime(x, "%H:%M:%S").time(),
-    ],
-    ">=": [
-        int,
-        float,
-        lambda x: datetime.strptime(x, "%Y-%m-%d").date(),
-        lambda x: datetime.strptime(x, "%H:%M:%S").time(),
-    ],
+_LOADERS = {
+    "selectin": selectinload,
+    "joined": joinedload,
+    "lazy": lazyload,
+    "noload": noload,
+    "raise": raiseload,
 }
 
 
-def convert_value(value, types):
-    """Tenta converter um valor em uma lista de tipos especificados."""
-    for conversion_fn in types:
+def _encode_cursor(
+    created_at: datetime, uuid_value: Any, direction: str
+) -> str:
+    """Gera um cursor opaco a partir da chave `(created_at, uuid)`."""
+    payload = json.dumps(
+        {"d": direction, "c": created_at.isoformat(), "u": str(uuid_value)}
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Decodifica um cursor gerado por `_encode_cursor`.
+
+    Raises:
+        CustomException: 422 em caso de cursor inválido.
+
+    Returns:
+        tuple: Direção ("next" ou "prev") e a chave `(created_at, uuid)`.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["d"] not in ("next", "prev"):
+            raise ValueError(payload["d"])
+        key = (
+            datetime.fromisoformat(payload["c"]),
+            uuid.UUID(payload["u"]),
+        )
+        return payload["d"], key
+    except Exception:
+        raise error.CustomException(status_code=422, detail="Cursor inválido.")
+
+
+def _keyset_cursors(
+    rows: list, direction: str, cursor: str | None, limit: int | None
+) -> tuple:
+    """Recorta a página buscada com uma linha extra e gera os cursores vizinhos.
+
+    As duas últimas colunas de cada linha devem ser `created_at` e `uuid`.
+
+    Returns:
+        tuple: As linhas da página na ordem crescente e o dicionário de cursores.
+    """
+    has_more = limit is not None and len(rows) > limit
+    rows = rows[:limit] if limit is not None else rows
+    if direction == "prev":
+        rows = rows[::-1]
+    has_next = has_more if direction == "next" else True
+    has_prev = bool(cursor) if direction == "next" else has_more
+    cursors = {"next_cursor": None, "prev_cursor": None}
+    if rows and has_next:
+        cursors["next_cursor"] = _encode_cursor(
+            rows[-1][-2], rows[-1][-1], "next"
+        )
+    if rows and has_prev:
+        cursors["prev_cursor"] = _encode_cursor(
+            rows[0][-2], rows[0][-1], "prev"
+        )
+    return rows, cursors
+
+
+def _page_data(rows: list, columns: list, all_data: bool) -> list:
+    """Remove as colunas auxiliares das linhas no formato devolvido por `query_params`."""
+    width = len(columns) or 1
+    if all_data and not columns:
+        data = [row[0] for row in rows]
+    else:
+        data = [row[:width] for row in rows]
+    if not all_data:
+        data = data[:1] or [None]
+    return data
+
+
+def _shape_rows(
+    rows: list, keys: list[str], output: str, types: dict | None = None
+):
+    """Converte as linhas de uma projeção para o formato pedido em `output`.
+
+    "rows" devolve uma lista de dicionários e "columns" um dicionário de listas,
+    aceito diretamente por `pd.DataFrame`; "arrow" devolve uma `pyarrow.Table`
+    tipada por `types`; "orm" mantém as linhas como estão.
+    """
+    if output == "arrow":
+        if not isinstance(rows, list):
+            # Já convertida durante a leitura com fetchmany.
+            return rows
+        return util.arrow_table(
+            keys, [[row for row in rows if row is not None]], types
+        )
+    if output == "rows":
+        return [
+            dict(zip(keys, row)) if row is not None else None for row in rows
+        ]
+    if output == "columns":
+        rows = [row for row in rows if row is not None]
+        return {
+            key: list(values)
+            for key, values in zip(
+                keys, zip(*rows) if rows else [()] * len(keys)
+            )
+        }
+    return rows
+
+
+@contextmanager
+def _session_scope(
+    session: Session | None = None, read_from: str | None = None, **options
+) -> Iterator[tuple]:
+    """Fornece a sessão usada por um método de `Base`.
+
+    Reutiliza a sessão recebida ou a da unidade de trabalho ativa; caso não exista,
+    abre uma nova sessão que é fechada ao final. Em leituras (`read_from` com o nome
+    da tabela) a nova sessão usa uma réplica quando disponível.
+
+    Yields:
+        tuple: A sessão e um bool indicando se ela pertence ao método.
+    """
+    session = session if session is not None else current_session()
+    if session is not None:
+        yield session, False
+        return
+    connection = connect_replica(read_from) if read_from else None
+    if connection is not None:
+        _db = SessionLocal(bind=connection, **options)
+    else:
+        _db = SessionLocal(**options)
+    try:
+        yield _db, True
+    finally:
+        _db.close()
+        if connection is not None:
+            connection.close()
+
+
+def _commit(_db: Session, owned: bool, *instances) -> None:
+    """Confirma a transação se a sessão pertence ao método.
+
+    Numa sessão compartilhada apenas envia as alterações (flush); o commit fica a
+    cargo de quem abriu a unidade de trabalho.
+    """
+    if not owned:
+        _db.flush()
+        return
+    _db.commit()
+    for instance in instances:
+        _db.refresh(instance)
+
+
+@asynccontextmanager
+async def _async_session_scope(
+    session: AsyncSession | None = None,
+) -> AsyncIterator[tuple]:
+    """Equivalente assíncrono de `_session_scope`.
+
+    Yields:
+        tuple: A `AsyncSession` e um bool indicando se ela pertence ao método.
+    """
+    if session is not None:
+        yield session, False
+        return
+    async with AsyncSessionLocal(bind=async_engine()) as _db:
+        yield _db, True
+
+
+def _on_async_loop(method: Callable) -> Callable:
+    """Executa o método assíncrono no loop de `async_loop` quando não recebe sessão.
+
+    Uma sessão própria usa o pool de `async_engine`, cujas conexões só servem no loop
+    de fundo. Uma `AsyncSession` recebida deve ter sido aberta nesse mesmo loop.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        if signature.bind(*args, **kwargs).arguments.get("session") is None:
+            return await on_async_loop(method(*args, **kwargs))
+        return await method(*args, **kwargs)
+
+    return wrapper
+
+
+async def _commit_async(_db: AsyncSession, owned: bool, *instances) -> None:
+    """Equivalente assíncrono de `_commit`."""
+    if not owned:
+        await _db.flush()
+        return
+    await _db.commit()
+    for instance in instances:
+        await _db.refresh(instance)
+
+
+async def _run_async(
+    method: Callable,
+    session: AsyncSession | None,
+    write: bool,
+    /,
+    *args,
+    **kwargs,
+) -> Any:
+    """Executa um método síncrono de `Base` em uma `AsyncSession`.
+
+    O método roda via `AsyncSession.run_sync` recebendo a sessão síncrona
+    subjacente em `session`, então a lógica é a mesma da versão síncrona, mas a E/S
+    do banco passa pelo driver assíncrono sem bloquear o event loop. Em escritas, o
+    commit é feito aqui quando a sessão pertence à chamada.
+    """
+    try:
+        async with _async_session_scope(session) as (_db, owned):
+            result = await _db.run_sync(
+                lambda sync_session: method(
+                    *args, session=sync_session, **kwargs
+                )
+            )
+            if write and owned:
+                await _db.commit()
+            return result
+    except Exception as e:
+        raise error.custom_HTTPException(e)
+
+
+def _run_batches(
+    _db: Session, owned: bool, items: list, batch_size: int | None, execute
+) -> tuple[list, list]:
+    """Executa `execute` para cada lote de `items`.
+
+    Numa sessão própria cada lote é confirmado individualmente; numa sessão
+    compartilhada cada lote roda em um SAVEPOINT. Um lote com erro é desfeito sem
+    interromper os demais.
+
+    Returns:
+        tuple: Resultados dos lotes concluídos e a lista de erros por lote.
+    """
+    batch_size = batch_size or core.settings.BULK_BATCH_SIZE
+    results, errors = [], []
+    for start in range(0, len(items), batch_size):
+        batch = items[start : start + batch_size]
         try:
-            return conversion_fn(value)
-        except Exception as e:
-            last_exception = e
-    raise error.CustomException(
-        status_code=422,
-        detail="O valor deve estar em um formato compatível com inteiros, floats, datas ou tempos.",
+            if owned:
+                result = execute(batch)
+                _db.commit()
+            else:
+                with _db.begin_nested():
+                    result = execute(batch)
+            results.append(result)
+        except SQLAlchemyError as e:
+            if owned:
+                _db.rollback()
+            errors.append(
+                {
+                    "batch": start // batch_size,
+                    "start": start,
+                    "size": len(batch),
+                    "detail": str(getattr(e, "orig", None) or e),
+                }
+            )
+    return results, errors
+
+
+def _raise_batch_errors(errors: list, processed: int) -> None:
+    if errors:
+        raise error.CustomException(
+            status_code=400,
+            detail={"processed": processed, "errors": errors},
+        )
+
+
+def _invalidate(model, _db: Session | AsyncSession, owned: bool) -> None:
+    """Descarta os dados em cache da tabela e das tabelas relacionadas após uma escrita.
+
+    As tabelas também passam a ser lidas do primário durante a janela de
+    read-your-writes (ver `db.session.mark_write`). Numa sessão compartilhada a
+    invalidação é adiada para o commit de quem a abriu; antes disso outra sessão
+    ainda leria os dados antigos e os colocaria de volta no cache.
+    """
+    if owned:
+        _invalidate_now(model)
+        return
+    if isinstance(_db, AsyncSession):
+        _db = _db.sync_session
+    if "invalidate" not in _db.info:
+        _db.info["invalidate"] = set()
+        event.listen(_db, "after_commit", _invalidate_on_commit)
+    _db.info["invalidate"].add(model)
+
+
+def _invalidate_on_commit(_db: Session) -> None:
+    pending = _db.info.get("invalidate", set())
+    while pending:
+        _invalidate_now(pending.pop())
+
+
+def _invalidate_now(model) -> None:
+    invalidate_counts(model.__tablename__)
+    tablenames = (
+        model.__tablename__,
+        *(
+            rel.mapper.class_.__tablename__
+            for rel in model.__mapper__.relationships
+        ),
     )
+    util.invalidate_cache(*tablenames)
+    mark_write(*tablenames)
 
 
 class Response:
@@ -86,6 +390,8 @@ class Response:
 
 class Base(DeclarativeBase):
     __name__: str
+    # colunas de texto com índice de busca para o operador "~"
+    __search_columns__: tuple[str, ...] = ()
     uuid: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
@@ -103,29 +409,54 @@ class Base(DeclarativeBase):
     def __tablename__(cls) -> str:
         return util.pascal_to_snake_case(cls.__name__)
 
-    def create(self) -> object:
+    @declared_attr
+    def __table_args__(cls) -> tuple:
+        # índice da paginação por cursor em query_params
+        indexes = [
+            Index(
+                f"ix_{cls.__tablename__}_created_at_uuid", "created_at", "uuid"
+            ),
+        ]
+        # índices trigram (pg_trgm) para as buscas com o operador "~";
+        # criados apenas no PostgreSQL
+        for name in cls.__search_columns__:
+            indexes.append(
+                Index(
+                    f"ix_{cls.__tablename__}_{name}_trgm",
+                    name,
+                    postgresql_using="gin",
+                    postgresql_ops={name: "gin_trgm_ops"},
+                ).ddl_if(dialect="postgresql")
+            )
+        return tuple(indexes)
+
+    def create(self, session: Session | None = None) -> object:
         try:
-            _db = SessionLocal()
-            data = self
-            _db.add(data)
-            _db.flush()
-            _db.commit()
-            _db.refresh(data)
-            return data
+            with _session_scope(session) as (_db, owned):
+                data = self
+                _db.add(data)
+                _commit(_db, owned, data)
+                _invalidate(self, _db, owned)
+                return data
 
         except SQLAlchemyError as e:
             raise error.custom_HTTPException(e)
-        finally:
-            _db.close()
 
     @classmethod
-    def login(self, attribute: str, value: Any, password: str) -> object:
+    def login(
+        self,
+        attribute: str,
+        value: Any,
+        password: str,
+        session: Session | None = None,
+    ) -> object:
         """executa login em usuario
 
         Args:
             attribute (str): Nome do atributo para verificar o valor
             value (str): username para efetuar o login
             password (str): senha para ser verificada
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
 
         Raises:
             CustomException: 404 usuario ou senha incorretos
@@ -136,39 +467,147 @@ class Base(DeclarativeBase):
             object: _description_
         """
         try:
-            _db = SessionLocal()
-            if not hasattr(self, attribute):
+            with _session_scope(session) as (_db, owned):
+                if not hasattr(self, attribute):
+                    raise error.CustomException(
+                        status_code=404,
+                        detail=f"Atributo '{attribute}' não encontrado na tabela '{self.__tablename__}'.",
+                    )
+
+                data = (
+                    _db.query(self)
+                    .filter(getattr(self, attribute) == value)
+                    .first()
+                )
+                if not data:
+                    raise error.CustomException(
+                        status_code=404,
+                        detail="Usuario ou senha invalidos",
+                    )
+                if hasattr(data, "active"):
+                    if not data.active:
+                        raise error.CustomException(
+                            status_code=401, detail="Usuario Inativo"
+                        )
+
+                if not core.verify_password(password, data.password):
+                    raise error.CustomException(
+                        status_code=401,
+                        detail="Usuario ou senha invalidos",
+                    )
+                return data
+        except Exception as e:
+            raise error.custom_HTTPException(e)
+
+    @classmethod
+    def _include_columns(self, include: list[str] | None) -> list:
+        """Valida e retorna as colunas solicitadas em `include`."""
+        if not include:
+            return []
+        for attr in include:
+            if not hasattr(self, attr):
                 raise error.CustomException(
                     status_code=404,
-                    detail=f"Atributo '{attribute}' não encontrado na tabela '{self.__tablename__}'.",
+                    detail=f"Atributo '{attr}' não encontrado na tabela '{self.__tablename__}'.",
                 )
+        return [getattr(self, attr) for attr in include]
 
-            data = (
-                _db.query(self)
-                .filter(getattr(self, attribute) == value)
-                .first()
+    @classmethod
+    def _filter_conditions(
+        self,
+        attribute: str | None = None,
+        value: str | None = None,
+        json_string: dict | None = None,
+        operator: str = "=",
+        filters: dict | None = None,
+    ) -> list:
+        """Monta a lista de condições de filtro utilizada por `query_params`.
+
+        Os filtros simples (`attribute`, `json_string`) e a árvore `filters` são
+        combinados com AND.
+
+        Raises:
+            CustomException: 404 em caso de atributo não relacionado na tabela.
+            CustomException: 422 em caso de operador ou valor inválido.
+
+        Returns:
+            list: Lista de expressões SQLAlchemy a serem aplicadas no WHERE.
+        """
+        conditions = []
+        if attribute:
+            conditions.append(
+                compile_filter(self, attribute, operator).condition(value)
             )
-            if not data:
+        if json_string:
+            if not isinstance(json_string, dict):
+                raise error.CustomException(
+                    status_code=422,
+                    detail=f"O valor a ser utilizado deve ser um dicionário.",
+                )
+            invalid_fields = [
+                field
+                for field in json_string.keys()
+                if not hasattr(self, field)
+            ]
+            if invalid_fields:
                 raise error.CustomException(
                     status_code=404,
-                    detail="Usuario ou senha invalidos",
+                    detail=f"Os campos '{', '.join(invalid_fields)}' não encontrados na tabela '{self.__tablename__}'.",
                 )
-            if hasattr(data, "active"):
-                if not data.active:
-                    raise error.CustomException(
-                        status_code=401, detail="Usuario Inativo"
-                    )
+            if operator not in ("=", "~"):
+                raise error.CustomException(
+                    status_code=422,
+                    detail=f"Operador '{operator}' não suportado para json_string.",
+                )
+            for field, val in json_string.items():
+                conditions.append(
+                    compile_filter(self, field, operator).condition(val)
+                )
+        if filters:
+            conditions.append(compile_tree(self, filters))
+        return conditions
+
+    @classmethod
+    def _load_options(self, load: dict[str, str] | None = None) -> list:
+        """Monta as opções de carregamento dos relacionamentos do modelo.
+
+        Coleções (um-para-muitos) usam `selectinload` por padrão: os filhos vêm em uma
+        segunda consulta com `IN`, sem multiplicar as linhas da consulta principal como
+        o JOIN faz. Relacionamentos escalares mantêm a estratégia do mapeamento.
 
-            if not core.verify_password(password, data.password):
+        Args:
+            load (dict[str, str] | None): Estratégia por relacionamento: "selectin",
+                "joined", "lazy", "noload" ou "raise". Ex.: `{"user_role": "noload"}`.
+
+        Raises:
+            CustomException: 404 em caso de relacionamento inexistente no modelo.
+            CustomException: 422 em caso de estratégia não suportada.
+
+        Returns:
+            list: Opções a serem aplicadas com `select(...).options(...)`.
+        """
+        load = load or {}
+        relationships = self.__mapper__.relationships
+        invalid = [name for name in load if name not in relationships]
+        if invalid:
+            raise error.CustomException(
+                status_code=404,
+                detail=f"Relacionamentos '{', '.join(invalid)}' não encontrados na tabela '{self.__tablename__}'.",
+            )
+        options = []
+        for name, relationship in relationships.items():
+            strategy = load.get(name)
+            if strategy is None and relationship.uselist:
+                strategy = "selectin"
+            if strategy is None:
+                continue
+            if strategy not in _LOADERS:
                 raise error.CustomException(
-                    status_code=401,
-                    detail="Usuario ou senha invalidos",
+                    status_code=422,
+                    detail=f"Estratégia de carregamento '{strategy}' não é suportada.",
                 )
-            return data
-        except Exception as e:
-            raise error.custom_HTTPException(e)
-        finally:
-            _db.close()
+            options.append(_LOADERS[strategy](getattr(self, name)))
+        return options
 
     @classmethod
     def query_params(
@@ -181,6 +620,14 @@ class Base(DeclarativeBase):
         skip: int | None = None,
         limit: int | None = None,
         include: list[str] | None = None,
+        window_count: bool = False,
+        cursor: str | None = None,
+        keyset: bool = False,
+        filters: dict | None = None,
+        load: dict[str, str] | None = None,
+        output: str = "orm",
+        count_mode: str = "exact",
+        session: Session | None = None,
     ) -> object:
         """Este método realiza consultas personalizadas de acordo com a requisição do front-end.
 
@@ -192,6 +639,25 @@ class Base(DeclarativeBase):
             skip (int | None, optional): Número da página em caso de busca paginada.
             limit (int | None, optional): Quantidade por página.
             exclude (list[str] | None): Lista de atributos a serem excluídos da consulta.
+            window_count (bool): Se True, os dados da página, o total filtrado (`count(*) OVER ()`)
+                e o total da tabela (em cache) são obtidos em uma única consulta.
+            cursor (str | None): Cursor opaco devolvido em `meta["next_cursor"]` ou
+                `meta["prev_cursor"]`. Quando informado, ativa a paginação por cursor e `skip` é ignorado.
+            keyset (bool): Se True, pagina por cursor em `(created_at, uuid)` a partir da primeira página.
+            filters (dict | None): Árvore de filtros com AND/OR/NOT, listas IN e verificação de nulos,
+                compilada na mesma consulta (ver `db.filters.compile_tree`).
+            load (dict[str, str] | None): Estratégia de carregamento por relacionamento
+                (ver `_load_options`). Ignorado quando `include` é informado, pois a consulta
+                devolve apenas colunas.
+            output (str): "orm" (padrão) devolve entidades, ou tuplas quando há `include`.
+                "rows" (lista de dicionários) e "columns" (dicionário de listas) selecionam
+                apenas as colunas de `include` (padrão: todas as não binárias) sem criar
+                objetos ORM, prontos para `pd.DataFrame`. "arrow" devolve uma `pyarrow.Table`
+                com colunas tipadas, lida em blocos com cursor no servidor (`yield_per`) e aceita por `st.dataframe`.
+            count_mode (str): Cálculo de `meta["total_data"]` e `meta["query_items"]`: "exact"
+                (padrão), "estimate" ou "cached" (ver `db.counts.count_rows`). `meta["approximate"]`
+                indica se o total é uma estimativa.
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
 
         Raises:
             CustomException: 404 em caso de busca com um atributo não relacionado na tabela.
@@ -201,168 +667,369 @@ class Base(DeclarativeBase):
             object: Retorna um objeto SQLAlchemy podendo ser vazio em caso de não encontrar nenhuma correspondência.
         """
 
-        _db = SessionLocal()
-
-        sub_count = False
+        keyset = keyset or cursor is not None
         try:
-            if include:
-                for attr in include:
-                    if not hasattr(self, attr):
-                        raise error.CustomException(
-                            status_code=404,
-                            detail=f"Atributo '{attr}' não encontrado na tabela '{self.__tablename__}'.",
-                        )
-
-                atributos = [getattr(self, attr) for attr in include]
-                query = select(*atributos)
-            else:
-                query = select(self)
-
-            if attribute:
-                # Verificar se o atributo é válido
-                if not hasattr(self, attribute):
-                    raise error.CustomException(
-                        status_code=404,
-                        detail=f"Atributo '{attribute}' não encontrado na tabela '{self.__tablename__}'.",
-                    )
-
-                # Construir a condição de filtro com base no operador
-                sub_count = True
-                if operator == "=":
-                    query = query.filter(getattr(self, attribute) == value)
-                elif operator == "~":
-                    if isinstance(getattr(self, attribute).type, String):
-                        query = query.filter(
-                            getattr(self, attribute).ilike(
-                                f"%{convert_value(value, type_mapping[operator])}%"
-                            )
-                        )
-                    else:
-                        raise error.CustomException(
-                            status_code=422,
-                            detail=f"o tipo do atributo a ser utilizado no operador '{operator}' deve ser String.",
-                        )
-                elif operator == "!":
-                    query = query.filter(getattr(self, attribute) != value)
-                elif operator == "<":
-                    query = query.filter(
-                        getattr(self, attribute)
-                        < convert_value(value, type_mapping[operator])
+            if output not in ("orm", "rows", "columns", "arrow"):
+                raise error.CustomException(
+                    status_code=422,
+                    detail=f"Formato de saída '{output}' não é suportado.",
+                )
+            if count_mode not in COUNT_MODES:
+                raise error.CustomException(
+                    status_code=422,
+                    detail=f"Modo de contagem '{count_mode}' não é suportado.",
+                )
+            if output != "orm" and not include:
+                include = [c.key for c in self._export_columns()]
+            columns = self._include_columns(include)
+            types = self._column_types(include) if output == "arrow" else None
+            with _session_scope(session, self.__tablename__) as (_db, owned):
+                conditions = self._filter_conditions(
+                    attribute, value, json_string, operator, filters
+                )
+                options = [] if columns else self._load_options(load)
+                if window_count:
+                    response = self._query_window(
+                        _db,
+                        conditions,
+                        columns,
+                        all_data,
+                        skip,
+                        limit,
+                        keyset,
+                        cursor,
+                        options,
+                        count_mode,
                     )
-                elif operator == ">":
-                    query = query.filter(
-                        getattr(self, attribute)
-                        > convert_value(value, type_mapping[operator])
+                    response.data = _shape_rows(
+                        response.data, include, output, types
                     )
-                elif operator == "<=":
-                    query = query.filter(
-                        getattr(self, attribute)
-                        <= convert_value(value, type_mapping[operator])
+                    return response
+
+                query = select(*columns) if columns else select(self)
+                query = query.where(*conditions).options(*options)
+
+                cursors = {}
+                if keyset:
+                    query, direction = self._keyset_page(
+                        query.add_columns(self.created_at, self.uuid),
+                        self.created_at,
+                        self.uuid,
+                        cursor,
+                        limit,
                     )
-                elif operator == ">=":
-                    query = query.filter(
-                        getattr(self, attribute)
-                        >= convert_value(value, type_mapping[operator])
+                    result = _db.execute(query)
+                    rows = (result if columns else result.unique()).all()
+                    rows, cursors = _keyset_cursors(
+                        rows, direction, cursor, limit
                     )
-                elif operator == "|":
-                    try:
-                        lower, upper = value.split("|")
-                        lower_value = convert_value(
-                            lower, type_mapping[operator]
-                        )
-                        upper_value = convert_value(
-                            upper, type_mapping[operator]
-                        )
-                        query = query.filter(
-                            getattr(self, attribute).between(
-                                lower_value, upper_value
-                            )
-                        )
-                    except Exception:
-                        raise error.CustomException(
-                            status_code=422,
-                            detail="O intervalo deve ser fornecido no formato correto, separado por '|'.",
-                        )
+                    data = _page_data(rows, columns, all_data)
                 else:
-                    raise error.CustomException(
-                        status_code=422,
-                        detail=f"Operador '{operator}' não é suportado.",
-                    )
-            if json_string:
-                if not isinstance(json_string, dict):
-                    raise error.CustomException(
-                        status_code=422,
-                        detail=f"O valor a ser utilizado deve ser um dicionário.",
-                    )
-                invalid_fields = [
-                    field
-                    for field in json_string.keys()
-                    if not hasattr(self, field)
-                ]
-                if invalid_fields:
-                    raise error.CustomException(
-                        status_code=404,
-                        detail=f"Os campos '{', '.join(invalid_fields)}' não encontrados na tabela '{self.__tablename__}'.",
-                    )
-                sub_count = True
-                for field, val in json_string.items():
-                    if operator == "=":
-                        query = query.filter(getattr(self, field) == val)
-                    elif operator == "~":
-                        attribute_type = (
-                            getattr(self, field).property.columns[0].type
-                        )
-                        if not isinstance(
-                            attribute_type, (String, Text, CHAR)
-                        ):
-                            raise error.CustomException(
-                                422,
-                                f"O operador ILIKE não pode ser aplicado ao tipo de dados do atributo '{field}'.",
+                    if skip is not None and limit is not None:
+                        _offset = skip * limit
+                        query = query.offset(_offset).limit(limit)
+                    if all_data:
+                        if output == "arrow":
+                            # Cursor no servidor: cada bloco é um fetchmany real
+                            query = query.execution_options(
+                                yield_per=core.settings.EXPORT_CHUNK_SIZE
                             )
-                        query = query.filter(
-                            getattr(self, field).ilike(f"%{val}%")
-                        )
+                            data = util.arrow_table(
+                                include,
+                                _db.execute(query).partitions(),
+                                types,
+                            )
+                        elif include:
+                            data = _db.execute(query).all()
+                        else:
+                            data = _db.execute(query).unique().scalars().all()
                     else:
-                        raise error.CustomException(
-                            status_code=422,
-                            detail=f"Operador '{operator}' não suportado para json_string.",
-                        )
+                        data = [_db.execute(query).first()]
+
+                total_data, approximate = count_rows(_db, self, (), count_mode)
+                meta = {
+                    "total_data": total_data,
+                    "query_items": (
+                        count_rows(_db, self, conditions, count_mode)[0]
+                        if conditions
+                        else total_data
+                    ),
+                    "approximate": approximate,
+                    **cursors,
+                }
+                return Response(
+                    data=_shape_rows(data, include, output, types), meta=meta
+                )
 
-            subquery = query.subquery()
-            if skip is not None and limit is not None:
-                _offset = skip * limit
-                query = query.offset(_offset).limit(limit)
-            if all_data:
-                if include:
-                    data = _db.execute(query).unique().all()
-                else:
-                    data = _db.execute(query).unique().scalars().all()
-            else:
-                data = [_db.execute(query).first()]
+        except Exception as e:
+            raise error.custom_HTTPException(e)
 
-            total_data = _db.query(func.count(self.uuid)).scalar()
-            meta = {
+    @classmethod
+    def _keyset_page(
+        self,
+        query,
+        created_at,
+        uuid_column,
+        cursor: str | None,
+        limit: int | None,
+    ) -> tuple:
+        """Aplica a paginação por cursor em `(created_at, uuid)`.
+
+        A página é localizada pelo índice a partir da chave do cursor, portanto o custo
+        de uma página profunda é o mesmo da primeira. Uma linha a mais é buscada para
+        saber se existe a próxima página.
+
+        Returns:
+            tuple: A consulta paginada e a direção ("next" ou "prev").
+        """
+        direction = "next"
+        if cursor:
+            direction, key = _decode_cursor(cursor)
+            boundary = tuple_(created_at, uuid_column)
+            query = query.where(
+                boundary > tuple_(*key)
+                if direction == "next"
+                else boundary < tuple_(*key)
+            )
+        if direction == "next":
+            query = query.order_by(created_at, uuid_column)
+        else:
+            query = query.order_by(created_at.desc(), uuid_column.desc())
+        if limit is not None:
+            query = query.limit(limit + 1)
+        return query, direction
+
+    @classmethod
+    def _query_window(
+        self,
+        _db: Session,
+        conditions: list,
+        columns: list,
+        all_data: bool,
+        skip: int | None,
+        limit: int | None,
+        keyset: bool = False,
+        cursor: str | None = None,
+        options: list | None = None,
+        count_mode: str = "exact",
+    ) -> Response:
+        """Executa `query_params` em uma única ida ao banco.
+
+        A página é selecionada em uma subconsulta sobre as chaves primárias junto com
+        `count(*) OVER ()`, que é avaliado antes do LIMIT e portanto devolve o total
+        filtrado. O total da tabela vem do cache ou da estimativa conforme `count_mode`;
+        quando não há valor, é calculado como subconsulta escalar no mesmo comando. O
+        JOIN final com a tabela mantém o carregamento dos relacionamentos fora da
+        contagem.
+        """
+        total_data, approximate = None, False
+        # Lida antes da consulta: uma escrita concorrente descarta o total calculado
+        generation = count_generation(self)
+        if count_mode == "estimate":
+            total_data = lookup_estimate(_db, self)
+            approximate = total_data is not None
+        elif count_mode == "cached":
+            total_data = lookup_count(self)
+        filtered = select(
+            self.uuid.label("uuid"),
+            self.created_at.label("created_at"),
+            func.count().over().label("query_items"),
+        ).where(*conditions)
+        if total_data is None:
+            filtered = filtered.add_columns(
+                select(func.count(self.uuid))
+                .correlate(None)
+                .scalar_subquery()
+                .label("total_data")
+            )
+        filtered = filtered.subquery("filtered")
+
+        page = select(filtered)
+        direction = None
+        if keyset:
+            page, direction = self._keyset_page(
+                page, filtered.c.created_at, filtered.c.uuid, cursor, limit
+            )
+        elif skip is not None and limit is not None:
+            page = page.offset(skip * limit).limit(limit)
+        elif not all_data:
+            page = page.limit(1)
+        page = page.subquery("page")
+
+        extra = [page.c.query_items]
+        if total_data is None:
+            extra.append(page.c.total_data)
+        query = (
+            select(
+                *(columns or [self]), *extra, page.c.created_at, page.c.uuid
+            )
+            .join(page, self.uuid == page.c.uuid)
+            .options(*(options or []))
+        )
+        if direction == "next":
+            query = query.order_by(page.c.created_at, page.c.uuid)
+        elif direction == "prev":
+            query = query.order_by(
+                page.c.created_at.desc(), page.c.uuid.desc()
+            )
+        result = _db.execute(query)
+        rows = (result if columns else result.unique()).all()
+
+        if rows:
+            query_items = rows[0].query_items
+            if total_data is None:
+                total_data = store_count(self, rows[0].total_data, generation)
+        else:
+            # Página vazia: sem linhas não há contagem da janela.
+            query_items = (
+                count_rows(_db, self, conditions, "exact")[0]
+                if skip or cursor
+                else 0
+            )
+            if total_data is None:
+                total_data = store_count(
+                    self, count_rows(_db, self, (), "exact")[0], generation
+                )
+
+        cursors = {}
+        if direction:
+            rows, cursors = _keyset_cursors(rows, direction, cursor, limit)
+        return Response(
+            data=_page_data(rows, columns, all_data),
+            meta={
                 "total_data": total_data,
-                "query_items": (
-                    _db.query(func.count()).select_from(subquery)
-                    if sub_count
-                    else total_data
-                ),
-            }
-            return Response(data=data, meta=meta)
+                "query_items": query_items,
+                "approximate": approximate,
+                **cursors,
+            },
+        )
+
+    @classmethod
+    def schema_columns(self, schema) -> list[str]:
+        """Retorna as colunas da tabela declaradas em um schema pydantic.
+
+        Usado com `include` e `output="columns"` para carregar só o que a tela exibe.
+        Relacionamentos e campos que não são colunas são ignorados.
 
+        Args:
+            schema (type[BaseModel]): Schema cujos campos serão projetados.
+
+        Returns:
+            list[str]: Nomes das colunas, na ordem dos campos do schema.
+        """
+        columns = self.__mapper__.column_attrs.keys()
+        return [name for name in schema.model_fields if name in columns]
+
+    @classmethod
+    def _column_types(self, keys: list[str]) -> dict:
+        """Tipo Python de cada coluna em `keys`, quando o tipo SQL o define."""
+        types = {}
+        for key in keys:
+            try:
+                types[key] = getattr(self, key).type.python_type
+            except NotImplementedError:
+                continue
+        return types
+
+    @classmethod
+    def _export_columns(self) -> list:
+        """Colunas exportadas por padrão: todas, exceto as binárias."""
+        return [
+            getattr(self, attr.key)
+            for attr in self.__mapper__.column_attrs
+            if not isinstance(attr.columns[0].type, LargeBinary)
+        ]
+
+    @classmethod
+    def query_stream(
+        self,
+        attribute: str | None = None,
+        value: str | None = None,
+        json_string: dict | None = None,
+        operator: str = "=",
+        filters: dict | None = None,
+        include: list[str] | None = None,
+        chunk_size: int | None = None,
+        session: Session | None = None,
+    ) -> Iterator[list]:
+        """Percorre o resultado de uma consulta em blocos com cursor no servidor.
+
+        Aceita os mesmos filtros de `query_params`, mas devolve apenas colunas e nunca
+        materializa o resultado inteiro: as linhas são lidas do banco com `yield_per`,
+        de modo que a memória fica limitada a `chunk_size` linhas.
+
+        Args:
+            include (list[str] | None): Atributos exportados. Padrão: todas as colunas não binárias.
+            chunk_size (int | None): Linhas por bloco. Padrão: `EXPORT_CHUNK_SIZE`.
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
+
+        Yields:
+            list: Bloco de linhas (tuplas na ordem de `include`).
+        """
+        try:
+            columns = self._include_columns(include) or self._export_columns()
+            conditions = self._filter_conditions(
+                attribute, value, json_string, operator, filters
+            )
+            query = (
+                select(*columns)
+                .where(*conditions)
+                .order_by(self.created_at, self.uuid)
+                .execution_options(
+                    yield_per=chunk_size or core.settings.EXPORT_CHUNK_SIZE
+                )
+            )
+            with _session_scope(session) as (_db, owned):
+                for partition in _db.execute(query).partitions():
+                    yield partition
         except Exception as e:
             raise error.custom_HTTPException(e)
 
-        finally:
-            _db.close()
+    @classmethod
+    def export_file(
+        self,
+        path: str,
+        file_format: str = "csv",
+        include: list[str] | None = None,
+        **params,
+    ) -> str:
+        """Exporta o resultado de uma consulta para CSV ou Parquet sem carregá-lo em memória.
+
+        Args:
+            path (str): Diretorio onde sera salvo o arquivo.
+            file_format (str): "csv" ou "parquet".
+            include (list[str] | None): Atributos exportados. Padrão: todas as colunas não binárias.
+            **params: Filtros aceitos por `query_stream`.
+
+        Raises:
+            CustomException: 422 em caso de formato não suportado.
+
+        Returns:
+            str: Nome do arquivo salvo.
+        """
+        writers = {
+            "csv": util.save_csv_stream,
+            "parquet": util.save_parquet_stream,
+        }
+        if file_format not in writers:
+            raise error.CustomException(
+                status_code=422,
+                detail=f"Formato '{file_format}' não suportado para exportação.",
+            )
+        header = include or [c.key for c in self._export_columns()]
+        chunks = self.query_stream(include=header, **params)
+        if file_format == "parquet":
+            types = self._column_types(header)
+            return writers[file_format](path, header, chunks, types)
+        return writers[file_format](path, header, chunks)
 
     @classmethod
-    def remove(self, uuid: UUID) -> str:
+    def remove(self, uuid: UUID, session: Session | None = None) -> str:
         """metodo utilizado para remover um dado da tabela correspondente
 
         Args:
             uuid (UUID): Id do dado a ser removido.
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
 
         Raises:
             CustomException: 404 em caso de nao encontar dado correspondete ao id remetido.
@@ -372,26 +1039,28 @@ class Base(DeclarativeBase):
             str: retorna ok em caso de sucesso.
         """
         try:
-            _db = SessionLocal()
-            data = _db.query(self).filter_by(uuid=uuid).first()
-            if not data:
-                raise error.CustomException(
-                    status_code=404, detail="Dado não encontrado"
-                )
-            _db.delete(data)
-            _db.commit()
-            return "OK"
+            with _session_scope(session) as (_db, owned):
+                data = _db.query(self).filter_by(uuid=uuid).first()
+                if not data:
+                    raise error.CustomException(
+                        status_code=404, detail="Dado não encontrado"
+                    )
+                _db.delete(data)
+                _commit(_db, owned)
+                _invalidate(self, _db, owned)
+                return "OK"
         except Exception as e:
             raise error.custom_HTTPException(e)
-        finally:
-            _db.close()
 
     @classmethod
-    def remove_data_and_files(self, uuid: UUID, files: list) -> str:
+    def remove_data_and_files(
+        self, uuid: UUID, files: list, session: Session | None = None
+    ) -> str:
         """metodo utilizado para remover um dado da tabela correspondente
 
         Args:
             uuid (UUID): Id do dado a ser removido.
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
 
         Raises:
             CustomException: 404 em caso de nao encontar dado correspondete ao id remetido.
@@ -401,53 +1070,52 @@ class Base(DeclarativeBase):
             str: retorna ok em caso de sucesso.
         """
         try:
-            _db = SessionLocal()
-            exclude_files = []
-            data = _db.query(self).filter_by(uuid=uuid).first()
-            if not data:
-                raise error.CustomException(
-                    status_code=404, detail="Dado não encontrado"
-                )
-            for f in files:
-                attr = getattr(data, f)
-                if attr:
-                    exclude_files.append(attr)
-
-            _db.delete(data)
-            _db.commit()
-
-            for exclude_f in exclude_files:
-                util.delete_file(core.settings.UPLOAD_DIR, exclude_f)
-            return "OK"
+            with _session_scope(session) as (_db, owned):
+                exclude_files = []
+                data = _db.query(self).filter_by(uuid=uuid).first()
+                if not data:
+                    raise error.CustomException(
+                        status_code=404, detail="Dado não encontrado"
+                    )
+                for f in files:
+                    attr = getattr(data, f)
+                    if attr:
+                        exclude_files.append(attr)
+
+                _db.delete(data)
+                _commit(_db, owned)
+                _invalidate(self, _db, owned)
+
+                for exclude_f in exclude_files:
+                    util.delete_file(core.settings.UPLOAD_DIR, exclude_f)
+                return "OK"
         except Exception as e:
             raise error.custom_HTTPException(e)
-        finally:
-            _db.close()
 
-    def flush(self) -> object:
+    def flush(self, session: Session | None = None) -> object:
         """Realiza um flush no banco, um processo que verifica toda a transação mas nao salva, utils para teste.
 
         Returns:
             object: retorna um objeto sqlalchemy
         """
         try:
-            _db = SessionLocal()
-            _db.add(self)
-            _db.flush()
-            _db.refresh(self)
-            _db.close()
-            return self
+            with _session_scope(session) as (_db, owned):
+                _db.add(self)
+                _db.flush()
+                _db.refresh(self)
+                return self
         except Exception as e:
             raise error.custom_HTTPException(e)
-        finally:
-            _db.close()
 
     @classmethod
-    def update(self, uuid: UUID, **json_data) -> object:
+    def update(
+        self, uuid: UUID, session: Session | None = None, **json_data
+    ) -> object:
         """funçao para atuilizar dados de uma tabela a partir de um dict
 
         Args:
             uuid (UUID): UUID do dado a ser atualizado
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
 
         Raises:
             CustomException: 404 caso nao haja correspondeica do uuid a dados nesta tabela
@@ -456,30 +1124,36 @@ class Base(DeclarativeBase):
             object: retorna o objeto atualizado
         """
         try:
-            _db = SessionLocal()
-            data = _db.query(self).filter_by(uuid=uuid).first()
-            if not data:
-                raise error.CustomException(
-                    status_code=404,
-                    detail="Dado não encontrado",
-                )
-            for key, value in json_data.items():
-                setattr(data, key, value)
-            _db.add(data)
-            _db.commit()
-            _db.refresh(data)
-            return data
+            with _session_scope(session) as (_db, owned):
+                data = _db.query(self).filter_by(uuid=uuid).first()
+                if not data:
+                    raise error.CustomException(
+                        status_code=404,
+                        detail="Dado não encontrado",
+                    )
+                for key, value in json_data.items():
+                    setattr(data, key, value)
+                _db.add(data)
+                _commit(_db, owned, data)
+                _invalidate(self, _db, owned)
+                return data
         except Exception as e:
             raise error.custom_HTTPException(e)
-        finally:
-            _db.close()
 
     @classmethod
-    async def update_form(self, uuid: UUID, files: list, **form) -> object:
+    @_on_async_loop
+    async def update_form(
+        self,
+        uuid: UUID,
+        files: list,
+        session: AsyncSession | None = None,
+        **form,
+    ) -> object:
         """funçao para atuilizar dados de uma tabela a partir de um dict
 
         Args:
             uuid (UUID): UUID do dado a ser atualizado
+            session (AsyncSession | None): Sessão assíncrona a ser reutilizada. Por padrão abre uma nova.
 
         Raises:
             CustomException: 404 caso nao haja correspondeica do uuid a dados nesta tabela
@@ -487,34 +1161,36 @@ class Base(DeclarativeBase):
         Returns:
             object: retorna o objeto atualizado
         """
+        list_exclude_files = []
+        except_exlude_files = []
         try:
-            _db = SessionLocal()
-            list_exclude_files = []
-            except_exlude_files = []
-            data = _db.query(self).filter_by(uuid=uuid).first()
-            if not data:
-                raise error.CustomException(
-                    status_code=404,
-                    detail="Dado não encontrado",
-                )
+            async with _async_session_scope(session) as (_db, owned):
+                data = await _db.scalar(select(self).filter_by(uuid=uuid))
+                if not data:
+                    raise error.CustomException(
+                        status_code=404,
+                        detail="Dado não encontrado",
+                    )
 
-            for key, value in form.items():
-                if value or str(type(value)) == "<class 'bool'>":
-                    if key in files:
-                        if getattr(data, key):
-                            list_exclude_files.append(getattr(data, key))
-                        filename = await util.save_file(value, "image")
-                        except_exlude_files.append(filename)
-                        setattr(data, key, filename)
-                    else:
-                        setattr(data, key, value)
-            _db.add(data)
-            _db.commit()
-            _db.refresh(data)
-            if list_exclude_files:
-                for filename in list_exclude_files:
-                    util.delete_file(core.settings.UPLOAD_DIR, filename)
-            return data
+                for key, value in form.items():
+                    if value or str(type(value)) == "<class 'bool'>":
+                        if key in files:
+                            if getattr(data, key):
+                                list_exclude_files.append(getattr(data, key))
+                            filename = await util.save_file(
+                                core.settings.UPLOAD_DIR, value, "image"
+                            )
+                            except_exlude_files.append(filename)
+                            setattr(data, key, filename)
+                        else:
+                            setattr(data, key, value)
+                _db.add(data)
+                await _commit_async(_db, owned, data)
+                _invalidate(self, _db, owned)
+                if list_exclude_files:
+                    for filename in list_exclude_files:
+                        util.delete_file(core.settings.UPLOAD_DIR, filename)
+                return data
 
         except Exception as e:
             if except_exlude_files:
@@ -528,30 +1204,30 @@ class Base(DeclarativeBase):
                     util.delete_file(core.settings.UPLOAD_DIR, filename)
             raise error.custom_HTTPException(e)
 
-        finally:
-            _db.close()
-
     @classmethod
-    async def create_form(self, files: list, **form) -> object:
+    @_on_async_loop
+    async def create_form(
+        self, files: list, session: AsyncSession | None = None, **form
+    ) -> object:
+        except_exlude_files = []
         try:
-            _db = SessionLocal()
-            except_exlude_files = []
-            data = self()
-            for key, value in form.items():
-                if value:
-                    for f in files:
-                        if key == f:
-                            filename = await util.save_file(
-                                core.settings.UPLOAD_DIR, value, f[key]
-                            )
-                            except_exlude_files.append(filename)
-                            setattr(data, key, filename)
-                        else:
-                            setattr(data, key, value)
-            _db.add(data)
-            _db.commit()
-            _db.refresh(data)
-            return data
+            async with _async_session_scope(session) as (_db, owned):
+                data = self()
+                for key, value in form.items():
+                    if value:
+                        for f in files:
+                            if key == f:
+                                filename = await util.save_file(
+                                    core.settings.UPLOAD_DIR, value, "image"
+                                )
+                                except_exlude_files.append(filename)
+                                setattr(data, key, filename)
+                            else:
+                                setattr(data, key, value)
+                _db.add(data)
+                await _commit_async(_db, owned, data)
+                _invalidate(self, _db, owned)
+                return data
 
         except Exception as e:
             if except_exlude_files:
@@ -559,82 +1235,351 @@ class Base(DeclarativeBase):
                     util.delete_file(core.settings.UPLOAD_DIR, filename)
             raise error.custom_HTTPException(e)
 
-        finally:
-            _db.close()
+    @classmethod
+    def bulk_create(
+        self,
+        data: list[dict],
+        batch_size: int | None = None,
+        session: Session | None = None,
+    ) -> list:
+        """Insere vários registros com `INSERT ... RETURNING` em lotes.
+
+        Cada lote é enviado em um único comando (executemany) e confirmado separadamente,
+        de forma que uma falha não descarta os lotes anteriores.
+
+        Args:
+            data (list[dict]): Lista com os valores de cada registro.
+            batch_size (int | None): Tamanho do lote. Padrão: `BULK_BATCH_SIZE`.
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
+
+        Raises:
+            CustomException: 400 com os lotes que falharam e a quantidade processada.
+
+        Returns:
+            list: Objetos inseridos.
+        """
+        try:
+            with _session_scope(session, expire_on_commit=False) as (
+                _db,
+                owned,
+            ):
+                try:
+                    results, errors = _run_batches(
+                        _db,
+                        owned,
+                        data,
+                        batch_size,
+                        lambda batch: _db.scalars(
+                            insert(self).returning(self), batch
+                        )
+                        .unique()
+                        .all(),
+                    )
+                finally:
+                    # Lotes anteriores a um erro inesperado já foram confirmados
+                    _invalidate(self, _db, owned)
+            created = [obj for result in results for obj in result]
+            _raise_batch_errors(errors, len(created))
+            return created
+        except Exception as e:
+            raise error.custom_HTTPException(e)
+
+    @classmethod
+    def bulk_update(
+        self,
+        data: list[dict] | None = None,
+        uuids: list[UUID] | None = None,
+        values: dict | None = None,
+        batch_size: int | None = None,
+        session: Session | None = None,
+    ) -> int:
+        """Atualiza vários registros em lotes.
+
+        Com `data`, cada dicionário deve conter o `uuid` e os valores daquele registro
+        (UPDATE por chave primária via executemany). Com `uuids` e `values`, os mesmos
+        valores são aplicados com `UPDATE ... WHERE uuid IN (...)`.
+
+        Args:
+            data (list[dict] | None): Valores por registro, incluindo o `uuid`.
+            uuids (list[UUID] | None): Registros que recebem os mesmos `values`.
+            values (dict | None): Valores aplicados a todos os `uuids`.
+            batch_size (int | None): Tamanho do lote. Padrão: `BULK_BATCH_SIZE`.
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
+
+        Raises:
+            CustomException: 422 em caso de parâmetros inválidos.
+            CustomException: 400 com os lotes que falharam e a quantidade processada.
+
+        Returns:
+            int: Quantidade de registros atualizados.
+        """
+        try:
+            if data is not None:
+                if any("uuid" not in item for item in data):
+                    raise error.CustomException(
+                        status_code=422,
+                        detail="Todos os registros devem informar o 'uuid'.",
+                    )
+                items = data
+
+                def execute(batch):
+                    _db.execute(update(self), batch)
+                    return len(batch)
+
+            elif uuids is not None and values:
+                items = uuids
+
+                def execute(batch):
+                    return _db.execute(
+                        update(self)
+                        .where(self.uuid.in_(batch))
+                        .values(**values)
+                    ).rowcount
+
+            else:
+                raise error.CustomException(
+                    status_code=422,
+                    detail="Informe 'data' ou 'uuids' e 'values' para atualizar.",
+                )
+
+            with _session_scope(session) as (_db, owned):
+                try:
+                    results, errors = _run_batches(
+                        _db, owned, items, batch_size, execute
+                    )
+                finally:
+                    _invalidate(self, _db, owned)
+            _raise_batch_errors(errors, sum(results))
+            return sum(results)
+        except Exception as e:
+            raise error.custom_HTTPException(e)
+
+    @classmethod
+    def bulk_remove(
+        self,
+        uuids: list[UUID],
+        batch_size: int | None = None,
+        session: Session | None = None,
+    ) -> int:
+        """Remove vários registros com `DELETE ... WHERE uuid IN (...)` em lotes.
+
+        Args:
+            uuids (list[UUID]): Ids dos dados a serem removidos.
+            batch_size (int | None): Tamanho do lote. Padrão: `BULK_BATCH_SIZE`.
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
+
+        Raises:
+            CustomException: 400 com os lotes que falharam e a quantidade processada.
+
+        Returns:
+            int: Quantidade de registros removidos.
+        """
+        try:
+            with _session_scope(session) as (_db, owned):
+                try:
+                    results, errors = _run_batches(
+                        _db,
+                        owned,
+                        uuids,
+                        batch_size,
+                        lambda batch: _db.execute(
+                            delete(self).where(self.uuid.in_(batch))
+                        ).rowcount,
+                    )
+                finally:
+                    _invalidate(self, _db, owned)
+            _raise_batch_errors(errors, sum(results))
+            return sum(results)
+        except Exception as e:
+            raise error.custom_HTTPException(e)
 
     @classmethod
     def get(
         self,
         attribute: str | None = None,
         value: Any | None = None,
+        load: dict[str, str] | None = None,
+        session: Session | None = None,
     ) -> object:
         """_summary_
 
         Args:
             attribute (str): _description_
             value (Any): _description_
+            load (dict[str, str] | None): Estratégia de carregamento por relacionamento (ver `_load_options`).
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
 
         Returns:
             object: _description_
         """
         try:
-            _db = SessionLocal()
-            data = (
-                _db.query(self)
-                .filter(getattr(self, attribute) == value)
-                .first()
-            )
+            with _session_scope(session, self.__tablename__) as (_db, owned):
+                data = (
+                    _db.query(self)
+                    .options(*self._load_options(load))
+                    .filter(getattr(self, attribute) == value)
+                    .first()
+                )
 
-            return data
+                return data
         except Exception as e:
             raise error.custom_HTTPException(e)
-        finally:
-            _db.close()
 
     @classmethod
     def count(
         cls,
         attribute: str | None = None,
         value: Any | None = None,
+        count_mode: str = "exact",
+        session: Session | None = None,
     ) -> int:
         """Retorna a quantidade de registros que correspondem à condição.
 
         Args:
             attribute (str): Nome do atributo para filtrar.
             value (Any): Valor a ser usado na condição de filtro.
+            count_mode (str): "exact" (padrão), "estimate" ou "cached" (ver `db.counts.count_rows`).
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
 
         Returns:
             int: A quantidade de registros que correspondem à condição.
         """
         try:
-            _db = SessionLocal()
-            query = _db.query(cls)
+            with _session_scope(session, cls.__tablename__) as (_db, owned):
+                conditions = []
+                if attribute is not None and value is not None:
+                    conditions.append(getattr(cls, attribute) == value)
+
+                count, _ = count_rows(_db, cls, conditions, count_mode)
+                return count
+        except Exception as e:
+            raise error.custom_HTTPException(e)
+
+    @_on_async_loop
+    async def create_async(
+        self, session: AsyncSession | None = None
+    ) -> object:
+        """Versão assíncrona de `create`.
+
+        Args:
+            session (AsyncSession | None): Sessão assíncrona a ser reutilizada. Por padrão abre uma nova.
+        """
+        return await _run_async(self.create, session, True)
+
+    @classmethod
+    @_on_async_loop
+    async def get_async(
+        self,
+        attribute: str | None = None,
+        value: Any | None = None,
+        load: dict[str, str] | None = None,
+        session: AsyncSession | None = None,
+    ) -> object:
+        """Versão assíncrona de `get`."""
+        return await _run_async(
+            self.get, session, False, attribute, value, load
+        )
 
-            if attribute is not None and value is not None:
-                query = query.filter(getattr(cls, attribute) == value)
+    @classmethod
+    @_on_async_loop
+    async def update_async(
+        self, uuid: UUID, session: AsyncSession | None = None, **json_data
+    ) -> object:
+        """Versão assíncrona de `update`."""
+        return await _run_async(self.update, session, True, uuid, **json_data)
+
+    @classmethod
+    @_on_async_loop
+    async def remove_async(
+        self, uuid: UUID, session: AsyncSession | None = None
+    ) -> str:
+        """Versão assíncrona de `remove`."""
+        return await _run_async(self.remove, session, True, uuid)
+
+    @classmethod
+    @_on_async_loop
+    async def query_params_async(
+        self, session: AsyncSession | None = None, **params
+    ) -> Response:
+        """Versão assíncrona de `query_params`, com os mesmos parâmetros."""
+        return await _run_async(self.query_params, session, False, **params)
 
-            count = query.count()
-            return count
+    @classmethod
+    @_on_async_loop
+    async def count_async(
+        cls,
+        attribute: str | None = None,
+        value: Any | None = None,
+        count_mode: str = "exact",
+        session: AsyncSession | None = None,
+    ) -> int:
+        """Versão assíncrona de `count`."""
+        return await _run_async(
+            cls.count, session, False, attribute, value, count_mode
+        )
+
+    @classmethod
+    def existing_values(
+        self, session: Session | None = None, **candidates: list
+    ) -> dict[str, set]:
+        """Verifica em uma única consulta quais valores candidatos já existem na tabela.
+
+        Args:
+            session (Session | None): Sessão a ser reutilizada. Por padrão usa a unidade de trabalho ativa ou abre uma nova.
+            **candidates (list): Valores candidatos por atributo, ex.: `username=[...], email=[...]`.
+
+        Raises:
+            CustomException: 404 em caso de atributo não relacionado na tabela.
+
+        Returns:
+            dict[str, set]: Valores já cadastrados por atributo.
+        """
+        try:
+            candidates = {
+                attr: set(values) for attr, values in candidates.items()
+            }
+            columns = self._include_columns(list(candidates))
+            found = {attr: set() for attr in candidates}
+            conditions = [
+                column.in_(values)
+                for column, values in zip(columns, candidates.values())
+                if values
+            ]
+            if not conditions:
+                return found
+            with _session_scope(session, self.__tablename__) as (_db, owned):
+                for row in _db.execute(
+                    select(*columns).where(or_(*conditions))
+                ):
+                    for attr, value in zip(candidates, row):
+                        if value in candidates[attr]:
+                            found[attr].add(value)
+            return found
         except Exception as e:
             raise error.custom_HTTPException(e)
-        finally:
-            _db.close()
 
     @classmethod
-    def unique_verify(self, attribute, value):
+    def unique_verify(self, attribute, value, session: Session | None = None):
         try:
-            _db = SessionLocal()
-            data = (
-                _db.query(self)
-                .filter(getattr(self, attribute) == value)
-                .first()
-            )
-            if data:
-                raise error.CustomException(
-                    status_code=422, detail=f"{value} ja existe"
+            with _session_scope(session, self.__tablename__) as (_db, owned):
+                data = (
+                    _db.query(self)
+                    .filter(getattr(self, attribute) == value)
+                    .first()
                 )
-            return value
+                if data:
+                    raise error.CustomException(
+                        status_code=422, detail=f"{value} ja existe"
+                    )
+                return value
         except Exception as e:
             raise error.custom_HTTPException(e)
-        finally:
-            _db.close()
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(
+        dialect="postgresql"
+    ),
+)
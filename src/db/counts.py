@@ -0,0 +1,171 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, select, text
+
+import core, error, util
+
+from .session import SessionLocal
+
+__all__ = [
+    "COUNT_MODES",
+    "count_rows",
+    "lookup_count",
+    "lookup_estimate",
+    "count_generation",
+    "store_count",
+    "invalidate_counts",
+]
+
+COUNT_MODES = ("exact", "estimate", "cached")
+
+# tabela -> (gravado em, total); só totais de tabela, para o cache não crescer com
+# cada busca. As entradas não expiram: são descartadas nas escritas ou pelo limite.
+_counts = util.TTLCache(core.settings.CACHE_MAX_ENTRIES, float("inf"))
+# Incrementada a cada escrita; descarta atualizações iniciadas antes dela
+_generations: dict[str, int] = {}
+_refreshing: set[str] = set()
+# tabela -> estimativa do planejador; evita consultar pg_class a cada página
+_estimates = util.TTLCache(
+    core.settings.CACHE_MAX_ENTRIES, core.settings.TOTAL_COUNT_CACHE_SECONDS
+)
+_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="count")
+
+
+def _total_statement(model):
+    return select(func.count()).select_from(model)
+
+
+def _store(tablename: str, value: int, generation: int) -> int:
+    with _lock:
+        if _generations.get(tablename, 0) == generation:
+            _counts.set(tablename, (time.monotonic(), value))
+    return value
+
+
+def _refresh(model, generation: int) -> None:
+    tablename = model.__tablename__
+    try:
+        with SessionLocal() as _db:
+            _store(tablename, _db.scalar(_total_statement(model)), generation)
+    except Exception:
+        logging.warning(
+            "Falha ao atualizar a contagem em cache de '%s'.", tablename
+        )
+    finally:
+        with _lock:
+            _refreshing.discard(tablename)
+
+
+def invalidate_counts(tablename: str) -> None:
+    """Descarta a contagem em cache da tabela após uma escrita."""
+    with _lock:
+        _counts.pop(tablename)
+        _generations[tablename] = _generations.get(tablename, 0) + 1
+
+
+def lookup_count(model) -> int | None:
+    """Retorna o total de linhas da tabela em cache.
+
+    Um total com mais de `TOTAL_COUNT_CACHE_SECONDS` continua sendo devolvido,
+    enquanto um novo é calculado em segundo plano; assim a página nunca espera pela
+    contagem exata depois do primeiro cálculo. Escritas na tabela descartam o cache.
+
+    Returns:
+        int | None: O total, ou None se ainda não houver valor em cache.
+    """
+    tablename = model.__tablename__
+    with _lock:
+        stored_at, value = _counts.get(tablename, (None, None))
+        if value is None:
+            return None
+        expired = (
+            time.monotonic() - stored_at
+            > core.settings.TOTAL_COUNT_CACHE_SECONDS
+        )
+        if expired and tablename not in _refreshing:
+            _refreshing.add(tablename)
+            _executor.submit(_refresh, model, _generations.get(tablename, 0))
+    return value
+
+
+def count_generation(model) -> int:
+    """Geração atual da contagem da tabela; leia antes de executar a contagem."""
+    with _lock:
+        return _generations.get(model.__tablename__, 0)
+
+
+def store_count(model, value: int, generation: int) -> int:
+    """Grava em cache o total de linhas da tabela.
+
+    Args:
+        generation (int): Valor de `count_generation` lido antes da consulta; o total
+            é descartado se houve escrita na tabela desde então.
+    """
+    return _store(model.__tablename__, value, generation)
+
+
+def _estimate(_db, model) -> int | None:
+    """Estimativa do planejador do PostgreSQL para o total de linhas da tabela."""
+    if _db.get_bind().dialect.name != "postgresql":
+        return None
+    value = _db.scalar(
+        text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)"
+        ),
+        {"name": model.__tablename__},
+    )
+    # reltuples é -1 enquanto a tabela não passou por VACUUM/ANALYZE
+    return value if value is not None and value >= 0 else None
+
+
+def lookup_estimate(_db, model) -> int | None:
+    """Estimativa do total de linhas da tabela, em cache por `TOTAL_COUNT_CACHE_SECONDS`.
+
+    Returns:
+        int | None: A estimativa, ou None fora do PostgreSQL ou antes do primeiro ANALYZE.
+    """
+    return _estimates.get_or_set(
+        model.__tablename__, lambda: _estimate(_db, model)
+    )
+
+
+def count_rows(
+    _db, model, conditions: list | tuple = (), mode: str = "exact"
+) -> tuple[int, bool]:
+    """Conta as linhas de `model` que atendem a `conditions`.
+
+    Modos:
+        "exact": `SELECT count(*)` a cada chamada.
+        "estimate": estimativa do planejador (`pg_class.reltuples`) para o total da
+            tabela, em cache (ver `lookup_estimate`); contagens filtradas e outros
+            bancos usam a contagem exata.
+        "cached": total da tabela em cache, atualizado em segundo plano (ver
+            `lookup_count`); contagens filtradas usam a contagem exata.
+
+    Raises:
+        CustomException: 422 em caso de modo não suportado.
+
+    Returns:
+        tuple[int, bool]: A contagem e se ela é aproximada.
+    """
+    if mode not in COUNT_MODES:
+        raise error.CustomException(
+            status_code=422,
+            detail=f"Modo de contagem '{mode}' não é suportado.",
+        )
+    statement = _total_statement(model).where(*conditions)
+    if mode == "estimate" and not conditions:
+        estimate = lookup_estimate(_db, model)
+        if estimate is not None:
+            return estimate, True
+    if mode == "cached" and not conditions:
+        value = lookup_count(model)
+        if value is None:
+            generation = count_generation(model)
+            value = store_count(model, _db.scalar(statement), generation)
+        return value, False
+    return _db.scalar(statement), False
@@ -0,0 +1,223 @@
+import functools
+import operator as op
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import String, and_, not_, or_
+from sqlalchemy.orm import ColumnProperty
+
+import error
+from util import FILTER_OPERATORS, parse_filter_tree
+
+__all__ = ["FilterPlan", "compile_filter", "compile_tree", "search_condition"]
+
+_COMPARISONS = {
+    "=": op.eq,
+    "!": op.ne,
+    "<": op.lt,
+    ">": op.gt,
+    "<=": op.le,
+    ">=": op.ge,
+}
+_GROUPS = {"and": and_, "or": or_}
+
+_BOOLEANS = {
+    **dict.fromkeys(("1", "true", "t", "sim"), True),
+    **dict.fromkeys(("0", "false", "f", "nao", "não"), False),
+}
+
+
+def _parse_bool(value: Any) -> bool:
+    """Aceita apenas valores booleanos explícitos; qualquer outro é um erro."""
+    try:
+        return _BOOLEANS[str(value).strip().lower()]
+    except KeyError:
+        raise ValueError(f"Valor booleano inválido: {value!r}")
+
+
+_PARSERS = {
+    int: int,
+    float: float,
+    Decimal: Decimal,
+    str: str,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+    uuid.UUID: uuid.UUID,
+    bool: _parse_bool,
+}
+
+
+def search_condition(column, value: str):
+    """Condição de busca parcial (`~`) sem diferenciar maiúsculas.
+
+    Gera `column ILIKE '%valor%'` diretamente sobre a coluna, o que no PostgreSQL é
+    atendido pelos índices trigram declarados em `__search_columns__`; em outros
+    bancos (ex.: SQLite nos testes) vira `lower(column) LIKE lower(...)`. Os
+    curingas digitados pelo usuário são escapados.
+    """
+    escaped = (
+        value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+
+class FilterPlan:
+    """Plano de filtro pré-compilado para um par (atributo, operador) de um modelo.
+
+    O tipo Python da coluna é resolvido uma única vez, então cada chamada converte
+    o valor com um único parser e apenas monta a expressão. Os valores entram como
+    parâmetros ligados, e a estrutura da consulta se repete entre chamadas,
+    aproveitando o cache de compilação do SQLAlchemy.
+
+    Attributes:
+        column: Atributo mapeado da coluna.
+        attribute (str): Nome do atributo.
+        operator (str): Operador de comparação.
+        python_type (type | None): Tipo Python da coluna, se conhecido.
+    """
+
+    def __init__(self, column, attribute: str, operator: str) -> None:
+        self.column = column
+        self.attribute = attribute
+        self.operator = operator
+        try:
+            self.python_type = column.type.python_type
+        except NotImplementedError:
+            self.python_type = None
+        self._parser = _PARSERS.get(self.python_type)
+
+    def parse(self, value: Any) -> Any:
+        """Converte o valor recebido para o tipo da coluna.
+
+        Raises:
+            CustomException: 422 em caso de valor incompatível com o tipo da coluna.
+        """
+        if (
+            value is None
+            or self._parser is None
+            or isinstance(value, self.python_type)
+        ):
+            return value
+        try:
+            return self._parser(value)
+        except (TypeError, ValueError, ArithmeticError):
+            raise error.CustomException(
+                status_code=422,
+                detail=f"O valor '{value}' não é compatível com o tipo do atributo '{self.attribute}'.",
+            )
+
+    def condition(self, value: Any):
+        """Monta a expressão de filtro para o valor informado."""
+        if self.operator == "~":
+            return search_condition(self.column, str(value))
+        if self.operator == "|":
+            try:
+                lower, upper = value.split("|")
+            except (AttributeError, ValueError):
+                raise error.CustomException(
+                    status_code=422,
+                    detail="O intervalo deve ser fornecido no formato correto, separado por '|'.",
+                )
+            return self.column.between(self.parse(lower), self.parse(upper))
+        if self.operator == "in":
+            if isinstance(value, str):
+                value = value.split(",")
+            if not isinstance(value, (list, tuple, set)):
+                raise error.CustomException(
+                    status_code=422,
+                    detail="O operador 'in' exige uma lista de valores.",
+                )
+            return self.column.in_([self.parse(item) for item in value])
+        if self.operator == "null":
+            try:
+                is_null = (
+                    value if isinstance(value, bool) else _parse_bool(value)
+                )
+            except ValueError:
+                raise error.CustomException(
+                    status_code=422,
+                    detail="O operador 'null' exige true ou false.",
+                )
+            return (
+                self.column.is_(None) if is_null else self.column.is_not(None)
+            )
+        return _COMPARISONS[self.operator](self.column, self.parse(value))
+
+
+@functools.lru_cache(maxsize=None)
+def compile_filter(model, attribute: str, operator: str) -> FilterPlan:
+    """Retorna o plano de filtro de `model.attribute` com `operator`, criado uma vez.
+
+    Raises:
+        CustomException: 404 em caso de atributo não relacionado na tabela.
+        CustomException: 422 em caso de operador não suportado ou incompatível com a coluna.
+
+    Returns:
+        FilterPlan: Plano reutilizado em todas as chamadas com a mesma combinação.
+    """
+    column = getattr(model, attribute, None)
+    if column is None:
+        raise error.CustomException(
+            status_code=404,
+            detail=f"Atributo '{attribute}' não encontrado na tabela '{model.__tablename__}'.",
+        )
+    if not isinstance(getattr(column, "property", None), ColumnProperty):
+        raise error.CustomException(
+            status_code=422,
+            detail=f"O atributo '{attribute}' não pode ser utilizado em filtros.",
+        )
+    if operator not in FILTER_OPERATORS:
+        raise error.CustomException(
+            status_code=422,
+            detail=f"Operador '{operator}' não é suportado.",
+        )
+    if operator == "~" and not isinstance(column.type, String):
+        raise error.CustomException(
+            status_code=422,
+            detail=f"o tipo do atributo a ser utilizado no operador '{operator}' deve ser String.",
+        )
+    return FilterPlan(column, attribute, operator)
+
+
+def compile_tree(model, tree: dict):
+    """Compila uma árvore de filtros em uma única expressão SQL.
+
+    Cada nó é um grupo `{"and": [...]}`, `{"or": [...]}`, `{"not": nó}` ou uma folha
+    `{"field": "username", "op": "~", "value": "ana"}`. As folhas aceitam os mesmos
+    operadores de `query_params` e também `"in"` (lista de valores) e `"null"`
+    (`true` para `IS NULL`, `false` para `IS NOT NULL`). Exemplo:
+
+        {"and": [
+            {"field": "email", "op": "~", "value": "@empresa.com"},
+            {"or": [
+                {"field": "username", "op": "in", "value": ["ana", "bia"]},
+                {"not": {"field": "updated_at", "op": "null", "value": true}},
+            ]},
+        ]}
+
+    Raises:
+        CustomException: 404 em caso de atributo não relacionado na tabela.
+        CustomException: 422 em caso de nó, operador ou valor inválido (a estrutura é
+            validada por `util.parse_filter_tree`).
+
+    Returns:
+        ColumnElement: Expressão a ser aplicada no WHERE.
+    """
+    try:
+        parse_filter_tree(tree)
+    except ValueError as e:
+        raise error.CustomException(status_code=422, detail=str(e))
+    return _compile_node(model, tree)
+
+
+def _compile_node(model, node: dict):
+    if "field" in node:
+        plan = compile_filter(model, node["field"], node.get("op", "="))
+        return plan.condition(node.get("value"))
+    ((key, children),) = node.items()
+    if key == "not":
+        return not_(_compile_node(model, children))
+    return _GROUPS[key](*(_compile_node(model, child) for child in children))
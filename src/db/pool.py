@@ -0,0 +1,120 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import QueuePool
+
+__all__ = ["MeteredQueuePool"]
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool que mede o tempo de espera para obter uma conexão.
+
+    Cada checkout é cronometrado e acumulado em um histograma por faixas, junto
+    com a quantidade de timeouts, para dimensionar `DB_POOL_SIZE` e
+    `DB_MAX_OVERFLOW` a partir do uso real. O tempo de abrir conexões novas
+    quando o pool cresce é medido à parte e não entra no histograma de espera.
+    """
+
+    # Limites superiores das faixas do histograma, em segundos
+    WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self._wait_counts = [0] * (len(self.WAIT_BUCKETS) + 1)
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._timeouts = 0
+        self._connects = 0
+        self._connect_total = 0.0
+        self._connect_max = 0.0
+        self._local = threading.local()
+
+    def _do_get(self):
+        local = self._local
+        if getattr(local, "timing", False):
+            # Chamada recursiva do QueuePool: já cronometrada pela externa
+            return super()._do_get()
+        local.timing, local.connect_seconds = True, 0.0
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            with self._metrics_lock:
+                self._timeouts += 1
+            raise
+        finally:
+            local.timing = False
+            self._observe(time.perf_counter() - start - local.connect_seconds)
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            seconds = time.perf_counter() - start
+            self._local.connect_seconds = (
+                getattr(self._local, "connect_seconds", 0.0) + seconds
+            )
+            with self._metrics_lock:
+                self._connects += 1
+                self._connect_total += seconds
+                self._connect_max = max(self._connect_max, seconds)
+
+    def _observe(self, seconds: float) -> None:
+        index = next(
+            (
+                i
+                for i, limit in enumerate(self.WAIT_BUCKETS)
+                if seconds <= limit
+            ),
+            len(self.WAIT_BUCKETS),
+        )
+        with self._metrics_lock:
+            self._wait_counts[index] += 1
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+
+    def metrics(self) -> dict:
+        """Retorna a utilização atual do pool e o histograma de espera.
+
+        Returns:
+            dict: `size`, `checked_out`, `checked_in`, `overflow`, `max_overflow`,
+                `timeout`, `checkouts`, `timeouts`, `wait_avg_ms`, `wait_max_ms`,
+                `wait_histogram` (faixa -> quantidade de checkouts), `connects`,
+                `connect_avg_ms` e `connect_max_ms`.
+        """
+        with self._metrics_lock:
+            counts = list(self._wait_counts)
+            total, longest, timeouts = (
+                self._wait_total,
+                self._wait_max,
+                self._timeouts,
+            )
+            connects, connect_total, connect_max = (
+                self._connects,
+                self._connect_total,
+                self._connect_max,
+            )
+        checkouts = sum(counts)
+        labels = [f"<= {limit * 1000:g} ms" for limit in self.WAIT_BUCKETS]
+        labels.append(f"> {self.WAIT_BUCKETS[-1] * 1000:g} ms")
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeout": self.timeout(),
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_avg_ms": total / checkouts * 1000 if checkouts else 0.0,
+            "wait_max_ms": longest * 1000,
+            "wait_histogram": dict(zip(labels, counts)),
+            "connects": connects,
+            "connect_avg_ms": (
+                connect_total / connects * 1000 if connects else 0.0
+            ),
+            "connect_max_ms": connect_max * 1000,
+        }
@@ -1,18 +1,250 @@
+import asyncio
+import functools
+import itertools
 import logging
-from typing import Annotated
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Annotated, Coroutine, Iterator
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 import core
 
-__all__ = ["SessionLocal", "engine"]
+from .pool import MeteredQueuePool
+
+__all__ = [
+    "SessionLocal",
+    "engine",
+    "unit_of_work",
+    "current_session",
+    "pool_metrics",
+    "replica_pool_metrics",
+    "AsyncSessionLocal",
+    "async_engine",
+    "async_loop",
+    "on_async_loop",
+    "run_async",
+    "replica_engines",
+    "connect_replica",
+    "mark_write",
+]
 
 # Configurando o log para exibir as queries
 # logging.basicConfig()
 # logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
 
+_pool_options = {
+    "pool_size": core.settings.DB_POOL_SIZE,
+    "max_overflow": core.settings.DB_MAX_OVERFLOW,
+    "pool_timeout": core.settings.DB_POOL_TIMEOUT,
+    "pool_recycle": core.settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": core.settings.DB_POOL_PRE_PING,
+}
+
 engine = create_engine(
-    core.settings.SQLALCHEMY_DATABASE_URI, pool_size=20, max_overflow=0
+    core.settings.SQLALCHEMY_DATABASE_URI,
+    poolclass=MeteredQueuePool,
+    **_pool_options,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Réplicas de leitura, usadas em rodízio pelos métodos somente leitura de `Base`
+replica_engines = [
+    create_engine(uri.strip(), poolclass=MeteredQueuePool, **_pool_options)
+    for uri in (core.settings.SQLALCHEMY_REPLICA_URIS or "").split(",")
+    if uri.strip()
+]
+_replica_cycle = itertools.cycle(replica_engines)
+_replica_lock = threading.Lock()
+_replica_down_until: dict = {}
+_last_write: dict[str, float] = {}
+
+
+def mark_write(*tablenames: str) -> None:
+    """Registra uma escrita nas tabelas, que passam a ser lidas do primário.
+
+    Durante `REPLICA_READ_YOUR_WRITES_SECONDS` as leituras dessas tabelas ignoram as
+    réplicas, para que o usuário veja o que acabou de gravar mesmo com atraso de
+    replicação.
+    """
+    now = time.monotonic()
+    for tablename in tablenames:
+        _last_write[tablename] = now
+
+
+def connect_replica(tablename: str) -> Connection | None:
+    """Abre uma conexão em uma réplica para ler `tablename`.
+
+    As réplicas são escolhidas em rodízio. Uma réplica que falha ao conectar fica
+    fora do rodízio por `REPLICA_RETRY_SECONDS`.
+
+    Returns:
+        Connection | None: Conexão com a réplica, ou None quando a leitura deve ir ao
+            primário (sem réplicas, escrita recente na tabela ou nenhuma disponível).
+    """
+    if not replica_engines:
+        return None
+    written = _last_write.get(tablename)
+    now = time.monotonic()
+    if (
+        written is not None
+        and now - written < core.settings.REPLICA_READ_YOUR_WRITES_SECONDS
+    ):
+        return None
+    for _ in range(len(replica_engines)):
+        with _replica_lock:
+            replica = next(_replica_cycle)
+        if _replica_down_until.get(replica, 0) > now:
+            continue
+        try:
+            return replica.connect()
+        except OperationalError:
+            logging.warning(
+                "Réplica %s indisponível, lendo do primário.",
+                replica.url.render_as_string(hide_password=True),
+            )
+            _replica_down_until[replica] = (
+                now + core.settings.REPLICA_RETRY_SECONDS
+            )
+    return None
+
+
+# Drivers assíncronos equivalentes aos síncronos da URI principal
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+# Vinculado ao engine assíncrono no primeiro uso: AsyncSessionLocal(bind=async_engine())
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+_async_loop: asyncio.AbstractEventLoop | None = None
+_async_loop_lock = threading.Lock()
+
+
+def async_loop() -> asyncio.AbstractEventLoop:
+    """Event loop em uma thread de fundo onde roda todo o acesso assíncrono ao banco.
+
+    As conexões do driver assíncrono ficam presas ao loop que as abriu. Como o
+    Streamlit não mantém um loop entre execuções do script, o pool de
+    `async_engine` só é usado neste loop, que dura o processo inteiro.
+    """
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="db-async-loop", daemon=True
+            ).start()
+            _async_loop = loop
+        return _async_loop
+
+
+async def on_async_loop(coro: Coroutine):
+    """Aguarda `coro` executada no loop de `async_loop`, a partir de qualquer loop."""
+    loop = async_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(
+        asyncio.run_coroutine_threadsafe(coro, loop)
+    )
+
+
+def run_async(coro: Coroutine):
+    """Executa `coro` no loop de `async_loop` a partir de código síncrono.
+
+    Examples:
+        >>> user = db.run_async(models.User.create_form(files, **form))
+    """
+    return asyncio.run_coroutine_threadsafe(coro, async_loop()).result()
+
+
+@functools.cache
+def async_engine() -> AsyncEngine:
+    """Retorna o engine assíncrono, criado no primeiro uso.
+
+    Usa `SQLALCHEMY_ASYNC_DATABASE_URI` ou, se ausente, a URI principal com o driver
+    assíncrono correspondente (ex.: `postgresql+asyncpg`). O pool segue as mesmas
+    configurações do engine síncrono e só deve ser usado em `async_loop`.
+
+    Raises:
+        ValueError: Se o banco da URI principal não tiver driver assíncrono conhecido.
+    """
+    uri = core.settings.SQLALCHEMY_ASYNC_DATABASE_URI
+    if uri is None:
+        url = make_url(core.settings.SQLALCHEMY_DATABASE_URI)
+        backend = url.get_backend_name()
+        if backend not in _ASYNC_DRIVERS:
+            raise ValueError(
+                f"Sem driver assíncrono para '{backend}'; defina SQLALCHEMY_ASYNC_DATABASE_URI."
+            )
+        uri = url.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}")
+    return create_async_engine(uri, **_pool_options)
+
+
+_current_session: ContextVar[Session | None] = ContextVar(
+    "current_session", default=None
+)
+
+
+def pool_metrics() -> dict:
+    """Retorna as métricas do pool de conexões do `engine` (ver `MeteredQueuePool.metrics`)."""
+    return engine.pool.metrics()
+
+
+def replica_pool_metrics() -> dict[str, dict]:
+    """Retorna as métricas do pool de cada réplica, pela URL sem senha."""
+    metrics = {}
+    for replica in replica_engines:
+        url = replica.url.render_as_string(hide_password=True)
+        metrics[url] = replica.pool.metrics()
+    return metrics
+
+
+def current_session() -> Session | None:
+    """Retorna a sessão da unidade de trabalho ativa, se houver."""
+    return _current_session.get()
+
+
+@contextmanager
+def unit_of_work() -> Iterator[Session]:
+    """Unidade de trabalho com uma única sessão e transação.
+
+    Todos os métodos de `Base` chamados dentro do bloco reutilizam a mesma sessão,
+    compartilhando o mapa de identidade e a conexão do pool. O commit é feito uma
+    única vez na saída do bloco e o rollback em caso de exceção. Blocos aninhados
+    reutilizam a unidade de trabalho externa. Leituras dentro do bloco usam a sessão
+    do primário, sem réplicas; telas apenas de leitura não precisam dele.
+
+    Examples:
+        >>> with db.unit_of_work():
+        ...     user = models.User(**data).create()
+        ...     models.UserRole(user_uuid=user.uuid, role_uuid=role_uuid).create()
+
+    Yields:
+        Session: A sessão compartilhada.
+    """
+    active = _current_session.get()
+    if active is not None:
+        yield active
+        return
+
+    session = SessionLocal(expire_on_commit=False)
+    token = _current_session.set(session)
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _current_session.reset(token)
+        session.close()
@@ -1,3 +1,4 @@
+from .email_outbox_model import EmailOutbox
 from .role_model import Role
 from .user_model import User
 from .user_role_model import UserRole
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+import db
+from db.base_class import Base
+
+
+class EmailOutbox(Base):
+    """Modelo da tabela de EmailOutbox
+
+    Fila persistente de emails, consumida por `services.email_outbox`.
+
+    Attributes:
+        receiver (str): email do destinatário.
+        subject (str): título do email.
+        body (str): conteúdo HTML do email.
+        status (str): "pending", "sent" ou "dead" (tentativas esgotadas).
+        attempts (int): quantidade de tentativas de envio.
+        next_attempt_at (datetime): momento a partir do qual o envio pode ser tentado.
+        last_error (str): erro da última tentativa.
+        sent_at (datetime): momento do envio.
+    """
+
+    receiver: db.Mapped[str] = db.mapped_column(db.String(100), nullable=False)
+    subject: db.Mapped[str] = db.mapped_column(db.String(250), nullable=False)
+    body: db.Mapped[str] = db.mapped_column(db.Text, nullable=False)
+    status: db.Mapped[str] = db.mapped_column(
+        db.String(20), default="pending", nullable=False, index=True
+    )
+    attempts: db.Mapped[int] = db.mapped_column(
+        db.Integer, default=0, nullable=False
+    )
+    next_attempt_at: db.Mapped[datetime] = db.mapped_column(
+        db.DateTime, default=datetime.now, nullable=False, index=True
+    )
+    last_error: db.Mapped[str | None] = db.mapped_column(db.Text)
+    sent_at: db.Mapped[datetime | None] = db.mapped_column(db.DateTime)
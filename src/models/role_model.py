@@ -10,6 +10,8 @@ class Role(Base):
         access_level(int): nivel de permição do papel.
     """
 
+    __search_columns__ = ("name",)
+
     name: db.Mapped[str] = db.mapped_column(
         db.String(45), nullable=False, unique=True
     )
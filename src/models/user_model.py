@@ -13,6 +13,8 @@ class User(Base):
         role_uuid (UUID): descrever role_uuid.
     """
 
+    __search_columns__ = ("username", "email")
+
     username: db.Mapped[str] = db.mapped_column(db.String(200))
     email: db.Mapped[str] = db.mapped_column(db.String(100))
     password: db.Mapped[bytes] = db.mapped_column(
@@ -22,5 +24,5 @@ class User(Base):
 
     # Relationships
     user_role: db.Mapped[list["UserRole"]] = db.relationship(
-        "UserRole", back_populates="user", lazy="joined"
+        "UserRole", back_populates="user", lazy="selectin"
     )
@@ -2,6 +2,8 @@ import streamlit as st
 import time
 import numpy as np
 
+import services.bootstrap  # noqa: F401 (inicia os serviços em segundo plano)
+
 st.set_page_config(page_title="Plotting Demo", page_icon="📈")
 
 st.markdown("# Plotting Demo")
@@ -0,0 +1,52 @@
+import pandas as pd
+import streamlit as st
+
+import db
+import services.bootstrap  # noqa: F401 (inicia os serviços em segundo plano)
+
+__all__ = ["show"]
+
+
+def show():
+    st.title("Pool de Conexões")
+    st.write("Utilização do pool de conexões do banco de dados.")
+
+    if st.button("Atualizar"):
+        st.rerun()
+
+    st.subheader("Primário")
+    _show_pool(db.pool_metrics())
+    for url, metrics in db.replica_pool_metrics().items():
+        st.subheader(f"Réplica {url}")
+        _show_pool(metrics)
+
+
+def _show_pool(metrics: dict) -> None:
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Em uso", f"{metrics['checked_out']} / {metrics['size']}")
+    col2.metric(
+        "Overflow", f"{metrics['overflow']} / {metrics['max_overflow']}"
+    )
+    col3.metric("Disponíveis", metrics["checked_in"])
+    col4.metric("Timeouts", metrics["timeouts"])
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Checkouts", metrics["checkouts"])
+    col2.metric("Espera média", f"{metrics['wait_avg_ms']:.2f} ms")
+    col3.metric("Espera máxima", f"{metrics['wait_max_ms']:.2f} ms")
+    col4.metric(
+        "Novas conexões",
+        metrics["connects"],
+        help=f"Tempo médio para conectar: {metrics['connect_avg_ms']:.2f} ms",
+    )
+
+    st.caption("Tempo de espera por conexão (sem o tempo de conectar)")
+    histogram = pd.DataFrame(
+        {"Checkouts": list(metrics["wait_histogram"].values())},
+        index=list(metrics["wait_histogram"].keys()),
+    )
+    st.bar_chart(histogram)
+
+
+if __name__ == "__main__":
+    show()
@@ -1,5 +1,6 @@
 import streamlit as st
 from components import RoleTable, RoleForm
+import services.bootstrap  # noqa: F401 (inicia os serviços em segundo plano)
 
 def show():
     st.title("Gerenciamento de Papéis")
@@ -1,5 +1,6 @@
 import streamlit as st
 from components import Charts
+import services.bootstrap  # noqa: F401 (inicia os serviços em segundo plano)
 
 __all__ = ["show"]
 
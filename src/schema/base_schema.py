@@ -3,9 +3,10 @@ from typing import Annotated
 from pydantic import BaseModel
 from pydantic.functional_validators import AfterValidator, BeforeValidator
 
-import util
+import error, util
 
 __all__ = [
+    "check_unique",
     "Password",
     "Username",
     "Email",
@@ -18,6 +19,7 @@ __all__ = [
 class MetaData(BaseModel):
     total_data: int
     query_items: int
+    approximate: bool = False
 
 
 Password = Annotated[bytes, AfterValidator(util.normalize_password)]
@@ -26,3 +28,39 @@ Email = Annotated[str, BeforeValidator(util.normalize_email)]
 Cpf = Annotated[str, AfterValidator(util.validate_cpf)]
 Cnpj = Annotated[str, AfterValidator(util.validate_cnpj)]
 CpfCnpj = Annotated[str, AfterValidator(util.validate_cnpj_cpf)]
+
+
+def check_unique(model, items: list[dict], attributes: list[str]) -> None:
+    """Verifica a unicidade de um lote de registros com uma única consulta.
+
+    Os valores de `attributes` de todos os itens são resolvidos juntos com
+    `model.existing_values`; valores repetidos dentro do próprio lote também são
+    rejeitados.
+
+    Args:
+        model: Modelo SQLAlchemy derivado de `Base`.
+        items (list[dict]): Registros a serem validados.
+        attributes (list[str]): Atributos que devem ser únicos.
+
+    Raises:
+        CustomException: 422 em caso de valor repetido no lote ou já cadastrado.
+    """
+    seen = {attr: set() for attr in attributes}
+    for item in items:
+        for attr in attributes:
+            value = item.get(attr)
+            if value is None:
+                continue
+            if value in seen[attr]:
+                raise error.CustomException(
+                    422, f"'{value}' está repetido no lote."
+                )
+            seen[attr].add(value)
+
+    existing = model.existing_values(**seen)
+    for item in items:
+        for attr in attributes:
+            if item.get(attr) in existing[attr]:
+                raise error.CustomException(
+                    422, f"'{item[attr]}' já está cadastrado."
+                )
@@ -1,11 +1,17 @@
 from datetime import date, datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    model_validator,
+)
 
 import error, models, util
 
-from .base_schema import MetaData
+from .base_schema import MetaData, check_unique
 from .types_annotated import *
 
 __all__ = [
@@ -31,24 +37,38 @@ class PostRole(BaseModel):
 
     @model_validator(mode="before")
     @classmethod
-    def validators_role(self, data) -> "PostRole":
+    def validators_role(self, data, info: ValidationInfo) -> "PostRole":
         try:
             if not "name" in data:
                 raise error.CustomException(
                     422,
                     "É necessário informar o name para prosseguir.",
                 )
-            if models.Role.get("name", data["name"]):
-                raise error.CustomException(
-                    422,
-                    f"'{data['name']}' já está cadastrado.",
-                )
-            False
-            pass
+            if not (info.context or {}).get("unique_checked"):
+                check_unique(models.Role, [data], ["name"])
             return data
         except Exception as e:
             raise error.custom_HTTPException(e)
 
+    @classmethod
+    def validate_many(self, items: list[dict]) -> list["PostRole"]:
+        """Valida um lote de papéis verificando os nomes em uma única consulta.
+
+        Args:
+            items (list[dict]): Dados dos papéis.
+
+        Returns:
+            list[PostRole]: Papéis validados.
+        """
+        try:
+            check_unique(models.Role, items, ["name"])
+            return [
+                self.model_validate(item, context={"unique_checked": True})
+                for item in items
+            ]
+        except Exception as e:
+            raise error.custom_HTTPException(e)
+
 class GetRole(BaseModel):
     """__summary__
 
@@ -1,11 +1,17 @@
 from datetime import date, datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    model_validator,
+)
 
-import error, models, util
+import core, error, models, util
 
-from .base_schema import MetaData
+from .base_schema import MetaData, check_unique
 from .types_annotated import *
 from .user_role_schema import GetUserRole
 
@@ -34,33 +40,48 @@ class PostUser(BaseModel):
 
     @model_validator(mode="before")
     @classmethod
-    def validators_user(self, data) -> "PostUser":
+    def validators_user(self, data, info: ValidationInfo) -> "PostUser":
         try:
             if not "username" in data:
                 raise error.CustomException(
                     422,
                     "É necessário informar o username para prosseguir.",
                 )
-            if models.User.get("username", data["username"]):
-                raise error.CustomException(
-                    422,
-                    f"'{data['username']}' já está cadastrado.",
-                )
             if not "email" in data:
                 raise error.CustomException(
                     422,
                     "É necessário informar o email para prosseguir.",
                 )
-            if models.User.get("email", data["email"]):
-                raise error.CustomException(
-                    422,
-                    f"'{data['email']}' já está cadastrado.",
-                )
-            pass
+            if not (info.context or {}).get("unique_checked"):
+                check_unique(models.User, [data], ["username", "email"])
             return data
         except Exception as e:
             raise error.custom_HTTPException(e)
 
+    @classmethod
+    def validate_many(self, items: list[dict]) -> list["PostUser"]:
+        """Valida um lote de usuários verificando username e email em uma única consulta.
+
+        As senhas do lote são transformadas em hash em paralelo pelo pool de processos.
+
+        Args:
+            items (list[dict]): Dados dos usuários.
+
+        Returns:
+            list[PostUser]: Usuários validados.
+        """
+        try:
+            check_unique(models.User, items, ["username", "email"])
+            items = [dict(item) for item in items]
+            to_hash = [item for item in items if item.get("password")]
+            hashes = core.hash_passwords([item["password"] for item in to_hash])
+            for item, hashed in zip(to_hash, hashes):
+                item["password"] = hashed
+            context = {"unique_checked": True, "password_hashed": True}
+            return [self.model_validate(item, context=context) for item in items]
+        except Exception as e:
+            raise error.custom_HTTPException(e)
+
 class GetUser(BaseModel):
     """__summary__
 
@@ -1,24 +1,213 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable
+
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from core import settings
+import util
 
 API_URL = settings.API_URL
 
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_metrics: dict[str, dict] = {}
+_metrics_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_async_client: httpx.AsyncClient | None = None
+
+
+def get_session() -> requests.Session:
+    """Sessão HTTP compartilhada com pool de conexões keep-alive.
+
+    As conexões TCP/TLS com a API são reutilizadas entre chamadas e entre threads do
+    Streamlit (o pool do urllib3 é thread-safe). Verbos idempotentes são repetidos
+    com espera exponencial em falhas de conexão e respostas 502/503/504.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=settings.API_RETRIES,
+                backoff_factor=settings.API_BACKOFF_FACTOR,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=settings.API_POOL_SIZE,
+                max_retries=retry,
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def _request(method: str, path: str, **kwargs) -> requests.Response:
+    """Executa uma requisição na API registrando a latência do endpoint."""
+    endpoint = f"{method} {path.split('?')[0]}"
+    kwargs.setdefault(
+        "timeout", (settings.API_CONNECT_TIMEOUT, settings.API_READ_TIMEOUT)
+    )
+    start = time.perf_counter()
+    failed = True
+    try:
+        response = get_session().request(method, f"{API_URL}{path}", **kwargs)
+        failed = response.status_code >= 500
+        return response
+    finally:
+        _record(endpoint, (time.perf_counter() - start) * 1000, failed)
+
+
+async def _request_async(method: str, path: str, **kwargs) -> httpx.Response:
+    """Versão assíncrona de `_request`, no cliente httpx do laço de fundo."""
+    global _async_client
+    if _async_client is None:
+        # Criado dentro do laço de fundo, ao qual suas conexões ficam vinculadas
+        _async_client = httpx.AsyncClient(
+            base_url=API_URL or "",
+            timeout=httpx.Timeout(
+                settings.API_READ_TIMEOUT, connect=settings.API_CONNECT_TIMEOUT
+            ),
+            # Repete apenas falhas de conexão, seguras inclusive para POST. Com um
+            # transporte próprio, os limites do pool precisam ser passados a ele.
+            transport=httpx.AsyncHTTPTransport(
+                retries=settings.API_RETRIES,
+                limits=httpx.Limits(max_connections=settings.API_POOL_SIZE),
+            ),
+        )
+    endpoint = f"{method} {path.split('?')[0]}"
+    start = time.perf_counter()
+    failed = True
+    try:
+        response = await _async_client.request(method, path, **kwargs)
+        failed = response.status_code >= 500
+        return response
+    finally:
+        _record(endpoint, (time.perf_counter() - start) * 1000, failed)
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Laço de eventos em uma thread de fundo, compartilhado pelas sessões do Streamlit."""
+    global _loop
+    with _session_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="api-client-loop", daemon=True
+            ).start()
+            _loop = loop
+        return _loop
+
+
+def run(awaitable: Awaitable):
+    """Executa uma corrotina no laço de fundo a partir do script síncrono do Streamlit."""
+    future = asyncio.run_coroutine_threadsafe(_await(awaitable), _event_loop())
+    return future.result()
+
+
+async def _await(awaitable: Awaitable):
+    return await awaitable
+
+
+async def _gather(*awaitables: Awaitable) -> list:
+    return list(await asyncio.gather(*awaitables))
+
+
+def gather(*awaitables: Awaitable) -> list:
+    """Busca recursos independentes em paralelo; a latência é a da chamada mais lenta.
+
+    Exemplo:
+        users, roles = ApiClient.gather(
+            ApiClient.get_users_async(), ApiClient.get_roles_async()
+        )
+    """
+    return run(_gather(*awaitables))
+
+
+def _record(endpoint: str, elapsed_ms: float, failed: bool) -> None:
+    with _metrics_lock:
+        metric = _metrics.setdefault(
+            endpoint, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        metric["count"] += 1
+        metric["errors"] += failed
+        metric["total_ms"] += elapsed_ms
+        metric["max_ms"] = max(metric["max_ms"], elapsed_ms)
+
+
+def api_metrics() -> dict[str, dict]:
+    """Latência por endpoint: chamadas, erros, média e máxima em ms."""
+    with _metrics_lock:
+        return {
+            endpoint: {
+                "count": metric["count"],
+                "errors": metric["errors"],
+                "avg_ms": metric["total_ms"] / metric["count"],
+                "max_ms": metric["max_ms"],
+            }
+            for endpoint, metric in _metrics.items()
+        }
+
+
 def get_users():
     try:
-        response = requests.get(f"{API_URL}/user/?all=true&operator=%3D&skip=0&limit=100")
+        response = _request(
+            "GET", "/user/?all=true&operator=%3D&skip=0&limit=100"
+        )
         return response.json()
     except Exception as e:
         return ["dia"]
 
 
 def create_user(user_data):
-    response = requests.post(f"{API_URL}/user", json=user_data)
+    response = _request("POST", "/user", json=user_data)
+    util.invalidate_cache("user")
     return response.json()
 
+
 def get_roles():
-    response = requests.get(f"{API_URL}/role/?all=true&operator=%3D&skip=0&limit=100")
+    response = _request("GET", "/role/?all=true&operator=%3D&skip=0&limit=100")
     return response.json()
 
+
 def create_role(role_data):
-    response = requests.post(f"{API_URL}/role", json=role_data)
+    response = _request("POST", "/role", json=role_data)
+    util.invalidate_cache("role")
+    return response.json()
+
+
+async def get_users_async():
+    try:
+        response = await _request_async(
+            "GET", "/user/?all=true&operator=%3D&skip=0&limit=100"
+        )
+        return response.json()
+    except Exception as e:
+        return ["dia"]
+
+
+async def create_user_async(user_data):
+    response = await _request_async("POST", "/user", json=user_data)
+    util.invalidate_cache("user")
+    return response.json()
+
+
+async def get_roles_async():
+    response = await _request_async(
+        "GET", "/role/?all=true&operator=%3D&skip=0&limit=100"
+    )
+    return response.json()
+
+
+async def create_role_async(role_data):
+    response = await _request_async("POST", "/role", json=role_data)
+    util.invalidate_cache("role")
     return response.json()
@@ -0,0 +1,38 @@
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+import core, db, models
+
+from . import email_outbox
+
+__all__ = ["start"]
+
+
+def _create_outbox_table() -> None:
+    """Cria a tabela `email_outbox` (e índices) se ainda não existir.
+
+    Uma falha só é registrada: se a tabela de fato não existir, o worker encerra
+    no primeiro ciclo.
+    """
+    try:
+        models.EmailOutbox.__table__.create(db.engine, checkfirst=True)
+    except SQLAlchemyError:
+        logging.exception("Não foi possível criar a tabela 'email_outbox'.")
+
+
+def start() -> None:
+    """Inicia os serviços em segundo plano.
+
+    O worker da fila de emails só é iniciado com `SMTP_HOST` configurado.
+    """
+    if not core.settings.SMTP_HOST:
+        logging.info("SMTP_HOST não configurado; fila de emails desativada.")
+        return
+    _create_outbox_table()
+    email_outbox.start_worker()
+
+
+# Importado por `Home.py` e por cada página, já que uma sessão pode abrir uma página
+# diretamente; o módulo é executado uma única vez por processo.
+start()
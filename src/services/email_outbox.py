@@ -0,0 +1,234 @@
+import logging
+import random
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import inspect, select, update
+
+import core, db, models, util
+
+
+__all__ = ["enqueue", "enqueue_many", "start_worker", "stop_worker"]
+
+# Tempo de reserva de um email retirado da fila; se o worker parar no meio do envio,
+# o email volta a ficar disponível depois desse prazo.
+LEASE_SECONDS = 300
+MAX_BACKOFF_SECONDS = 3600
+
+_wakeup = threading.Event()
+_worker: "OutboxWorker | None" = None
+_worker_lock = threading.Lock()
+
+
+def enqueue(
+    receiver: str, subject: str, body: str, session=None
+) -> models.EmailOutbox:
+    """Coloca um email na fila de envio.
+
+    Args:
+        receiver (str): Email do destinatário.
+        subject (str): Título do Email.
+        body (str): Conteúdo do email (pode ser gerado com util.template_string).
+        session (Session | None): Sessão a ser reutilizada, para enfileirar na mesma transação da escrita que originou o email.
+
+    Returns:
+        models.EmailOutbox: Registro enfileirado.
+    """
+    message = models.EmailOutbox(
+        receiver=receiver, subject=subject, body=body
+    ).create(session)
+    _wakeup.set()
+    return message
+
+
+def enqueue_many(emails: list[tuple[str, str, str]], session=None) -> list:
+    """Coloca vários emails na fila com `bulk_create`.
+
+    Args:
+        emails (list[tuple[str, str, str]]): Tuplas (destinatário, título, conteúdo).
+        session (Session | None): Sessão a ser reutilizada.
+
+    Returns:
+        list: Registros enfileirados.
+    """
+    messages = models.EmailOutbox.bulk_create(
+        [
+            {"receiver": receiver, "subject": subject, "body": body}
+            for receiver, subject, body in emails
+        ],
+        session=session,
+    )
+    _wakeup.set()
+    return messages
+
+
+def _backoff(attempts: int) -> timedelta:
+    """Espera exponencial com variação aleatória entre tentativas."""
+    seconds = min(
+        core.settings.EMAIL_OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1),
+        MAX_BACKOFF_SECONDS,
+    )
+    return timedelta(seconds=seconds * random.uniform(0.8, 1.2))
+
+
+class OutboxWorker(threading.Thread):
+    """Worker que esvazia a fila de emails em segundo plano.
+
+    A cada ciclo reserva um lote de emails pendentes com `FOR UPDATE SKIP LOCKED`
+    (vários workers não disputam as mesmas linhas), envia o lote dividido entre até
+    `EMAIL_OUTBOX_CONCURRENCY` conexões SMTP do pool e registra o resultado. Falhas
+    são repetidas com espera exponencial; após `EMAIL_OUTBOX_MAX_ATTEMPTS` o email
+    fica com status "dead".
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="email-outbox", daemon=True)
+        self._stopping = threading.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=core.settings.EMAIL_OUTBOX_CONCURRENCY,
+            thread_name_prefix="email-outbox-send",
+        )
+
+    def stop(self) -> None:
+        self._stopping.set()
+        _wakeup.set()
+
+    def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                claimed = self.drain_once()
+            except Exception:
+                if not self._table_exists():
+                    logging.error(
+                        "Tabela 'email_outbox' não existe; worker da fila de emails encerrado."
+                    )
+                    break
+                logging.exception("Falha ao processar a fila de emails.")
+                claimed = 0
+            if claimed < core.settings.EMAIL_OUTBOX_BATCH_SIZE:
+                _wakeup.wait(core.settings.EMAIL_OUTBOX_POLL_SECONDS)
+                _wakeup.clear()
+        self._executor.shutdown(wait=True)
+
+    @staticmethod
+    def _table_exists() -> bool:
+        """Verifica se a tabela da fila existe; na dúvida (ex.: banco fora do ar), sim."""
+        try:
+            return inspect(db.engine).has_table(
+                models.EmailOutbox.__tablename__
+            )
+        except Exception:
+            return True
+
+    def _claim(self) -> list:
+        """Reserva um lote de emails pendentes, adiando a próxima tentativa pelo prazo da reserva."""
+        now = datetime.now()
+        with db.SessionLocal(expire_on_commit=False) as session:
+            messages = (
+                session.execute(
+                    select(models.EmailOutbox)
+                    .where(
+                        models.EmailOutbox.status == "pending",
+                        models.EmailOutbox.next_attempt_at <= now,
+                    )
+                    .order_by(models.EmailOutbox.next_attempt_at)
+                    .limit(core.settings.EMAIL_OUTBOX_BATCH_SIZE)
+                    .with_for_update(skip_locked=True)
+                )
+                .scalars()
+                .all()
+            )
+            for message in messages:
+                message.attempts += 1
+                message.next_attempt_at = now + timedelta(
+                    seconds=LEASE_SECONDS
+                )
+            session.commit()
+        return messages
+
+    @staticmethod
+    def _send(messages: list) -> dict:
+        """Envia os emails por uma conexão do pool; devolve o erro de cada falha."""
+        try:
+            failures = util.smtp_pool().send_many(
+                (
+                    message.receiver,
+                    util.build_message(
+                        message.receiver, message.subject, message.body
+                    ),
+                )
+                for message in messages
+            )
+        except (smtplib.SMTPException, OSError) as e:
+            return {message.uuid: repr(e) for message in messages}
+        return {messages[index].uuid: repr(e) for index, e in failures.items()}
+
+    def drain_once(self) -> int:
+        """Executa um ciclo do worker.
+
+        Returns:
+            int: Quantidade de emails retirados da fila.
+        """
+        messages = self._claim()
+        if not messages:
+            return 0
+        chunks = [
+            messages[i :: core.settings.EMAIL_OUTBOX_CONCURRENCY]
+            for i in range(core.settings.EMAIL_OUTBOX_CONCURRENCY)
+        ]
+        errors = {}
+        for result in self._executor.map(self._send, filter(None, chunks)):
+            errors.update(result)
+
+        now = datetime.now()
+        changes = []
+        for message in messages:
+            if message.uuid not in errors:
+                changes.append(
+                    {"uuid": message.uuid, "status": "sent", "sent_at": now}
+                )
+            elif message.attempts >= core.settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                logging.error(
+                    f"Email {message.uuid} para {message.receiver} descartado após {message.attempts} tentativas."
+                )
+                changes.append(
+                    {
+                        "uuid": message.uuid,
+                        "status": "dead",
+                        "last_error": errors[message.uuid],
+                    }
+                )
+            else:
+                changes.append(
+                    {
+                        "uuid": message.uuid,
+                        "next_attempt_at": now + _backoff(message.attempts),
+                        "last_error": errors[message.uuid],
+                    }
+                )
+        with db.SessionLocal() as session:
+            session.execute(update(models.EmailOutbox), changes)
+            session.commit()
+        return len(messages)
+
+
+def start_worker() -> OutboxWorker:
+    """Inicia o worker da fila de emails, uma única vez por processo.
+
+    Chamado por `services.bootstrap` quando `SMTP_HOST` está configurado.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = OutboxWorker()
+            _worker.start()
+        return _worker
+
+
+def stop_worker() -> None:
+    """Sinaliza o worker para encerrar após o ciclo atual."""
+    with _worker_lock:
+        if _worker is not None:
+            _worker.stop()
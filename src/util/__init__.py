@@ -1,4 +1,5 @@
 from .annotated import *
+from .cache import *
 from .email import *
 from .functions import *
 from .validators import *
@@ -1,6 +1,51 @@
 import ast
 import json
 
+FILTER_OPERATORS = {"=", "~", "!", "<", ">", "<=", ">=", "|", "in", "null"}
+
+
+def parse_filter_tree(node) -> dict:
+    """
+    Valida a estrutura de uma árvore de filtros (ver `QueryParameters.filters`).
+
+    É a mesma validação aplicada por `db.filters.compile_tree` antes de compilar a
+    árvore; os tipos dos valores são conferidos na compilação, por coluna.
+
+    Raises:
+        ValueError: Em caso de nó, grupo ou operador inválido.
+    """
+    if not isinstance(node, dict):
+        raise ValueError("Cada nó de 'filters' deve ser um dicionário!")
+    if "field" in node:
+        operator = node.get("op", "=")
+        if not isinstance(node["field"], str):
+            raise ValueError("O campo 'field' de 'filters' deve ser uma string!")
+        if operator not in FILTER_OPERATORS:
+            raise ValueError(
+                f"Operador '{operator}' inválido em 'filters'. Os operadores válidos são: {', '.join(sorted(FILTER_OPERATORS))}"
+            )
+        if operator == "in" and not isinstance(node.get("value"), list):
+            raise ValueError("O operador 'in' exige uma lista em 'value'!")
+        return node
+    if len(node) != 1:
+        raise ValueError(
+            "Cada grupo de 'filters' deve ter uma única chave: 'and', 'or' ou 'not'!"
+        )
+    ((key, children),) = node.items()
+    if key == "not":
+        parse_filter_tree(children)
+    elif key in ("and", "or"):
+        if not isinstance(children, list) or not children:
+            raise ValueError(
+                f"O grupo '{key}' de 'filters' deve ser uma lista não vazia!"
+            )
+        for child in children:
+            parse_filter_tree(child)
+    else:
+        raise ValueError(f"Grupo '{key}' inválido em 'filters'!")
+    return node
+
+
 class QueryParameters:
     """
     Classe para definir os parâmetros de consulta.
@@ -19,6 +64,14 @@ class QueryParameters:
         limit (int, optional): Número máximo de itens a serem retornados. Default é 100.
         include (list[str], optional): Lista de atributos a serem devolvidos na consulta, se None todos serão devolvidos.
         json_string (str, optional): Estrutura JSON com um ou mais atributos para serem pesquisados.
+        cursor (str, optional): Cursor opaco devolvido em "next_cursor" ou "prev_cursor" da consulta anterior.
+            Substitui "skip" na paginação por cursor.
+        keyset (bool, optional): Ativa a paginação por cursor a partir da primeira página. Default é False.
+        filters (str, optional): Árvore JSON de filtros combinados em uma única consulta. Grupos
+            "and"/"or" recebem listas de nós e "not" recebe um nó; as folhas têm "field", "op" e "value",
+            com os operadores acima e também "in" (lista de valores) e "null" (true/false).
+            Exemplo: '{"or": [{"field": "username", "op": "in", "value": ["ana", "bia"]},
+            {"field": "email", "op": "~", "value": "@empresa.com"}]}'.
     """
 
     def __init__(
@@ -31,6 +84,9 @@ class QueryParameters:
         limit: int = 100,
         include: list = None,
         json_string: str = None,
+        cursor: str = None,
+        keyset: bool = False,
+        filters: str = None,
     ):
         valid_operators = {"=", "~", "!", "<", ">", "<=", ">=", "|"}
 
@@ -62,12 +118,19 @@ class QueryParameters:
                 "O valor de 'skip' deve ser >= 0 e 'limit' deve ser > 0."
             )
 
+        if cursor is not None and skip:
+            raise ValueError(
+                "Utilize 'cursor' ou 'skip' para paginar, não ambos."
+            )
+
         self.all_data = all_data
         self.attribute = attribute
         self.value = value
         self.operator = operator
         self.skip = skip
         self.limit = limit
+        self.cursor = cursor
+        self.keyset = keyset or cursor is not None
 
         # Parse json_string if provided
         if json_string is not None:
@@ -84,6 +147,19 @@ class QueryParameters:
         else:
             self.json_string = None
 
+        # Parse filters if provided
+        if filters is not None:
+            if isinstance(filters, str):
+                try:
+                    filters = json.loads(filters)
+                except json.JSONDecodeError:
+                    raise ValueError(
+                        "O parâmetro 'filters' deve ser uma string JSON válida!"
+                    )
+            self.filters = parse_filter_tree(filters)
+        else:
+            self.filters = None
+
         # Validate include list if provided
         if include is not None:
             if not isinstance(include, list):
@@ -105,5 +181,8 @@ class QueryParameters:
             "limit": self.limit,
             "include": self.include,
             "json_string": self.json_string,
+            "cursor": self.cursor,
+            "keyset": self.keyset,
+            "filters": self.filters,
         }
 
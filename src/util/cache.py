@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import core
+
+__all__ = ["TTLCache", "get_cache", "bind_cache", "invalidate_cache"]
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Cache em memória com expiração (TTL) e limite de entradas (LRU).
+
+    Seguro para uso a partir das threads de script do Streamlit.
+
+    Attributes:
+        max_entries (int): Quantidade máxima de entradas; a menos usada é descartada.
+        ttl (float): Validade padrão de cada entrada em segundos.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_or_set(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: float | None = None,
+    ) -> Any:
+        """Retorna o valor em cache ou executa `loader` e armazena o resultado."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value, ttl)
+        return value
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_caches: dict[str, TTLCache] = {}
+_bindings: dict[str, list[TTLCache]] = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(name: str) -> TTLCache:
+    """Retorna o cache de dados identificado por `name`, criando-o se necessário.
+
+    O cache é invalidado por `invalidate_cache(name)`. Para tabelas, `name` é o
+    `__tablename__` do modelo, invalidado automaticamente nas escritas de `Base`.
+
+    Args:
+        name (str): Nome do cache.
+
+    Returns:
+        TTLCache: Cache com `CACHE_TTL_SECONDS` e `CACHE_MAX_ENTRIES`.
+    """
+    with _registry_lock:
+        if name not in _caches:
+            _caches[name] = TTLCache(
+                core.settings.CACHE_MAX_ENTRIES,
+                core.settings.CACHE_TTL_SECONDS,
+            )
+            _bindings.setdefault(name, []).append(_caches[name])
+        return _caches[name]
+
+
+def bind_cache(name: str, cache: TTLCache) -> None:
+    """Registra um cache próprio para ser limpo junto com `invalidate_cache(name)`."""
+    with _registry_lock:
+        _bindings.setdefault(name, []).append(cache)
+
+
+def invalidate_cache(*names: str) -> None:
+    """Limpa todos os caches registrados nos nomes informados."""
+    with _registry_lock:
+        caches = [cache for name in names for cache in _bindings.get(name, [])]
+    for cache in caches:
+        cache.clear()
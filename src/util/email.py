@@ -1,11 +1,115 @@
+import functools
 import logging
+import os
+import re
 import smtplib
+import threading
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Iterable
 
 import core, error
 
-__all__ = ["template_string", "send_email"]
+__all__ = [
+    "template_string",
+    "render_many",
+    "Template",
+    "TemplateRegistry",
+    "template_registry",
+    "send_email",
+    "send_many",
+    "build_message",
+    "SMTPPool",
+    "smtp_pool",
+]
+
+
+# Variáveis no formato "{{ chave }}"
+_PLACEHOLDER = re.compile(r"\{\{ (.+?) \}\}")
+
+
+class Template:
+    """Template de email compilado.
+
+    O texto é dividido uma única vez em segmentos fixos intercalados com os nomes
+    das variáveis, de modo que a renderização é uma só passada de `join`, sem uma
+    busca no texto inteiro por chave. Variáveis ausentes em `content` são mantidas
+    como no texto original.
+
+    Args:
+        source (str): Texto do template.
+    """
+
+    def __init__(self, source: str) -> None:
+        parts = _PLACEHOLDER.split(source)
+        self.segments = parts[0::2]
+        self.keys = parts[1::2]
+
+    def render(self, content: dict) -> str:
+        """Preenche o template com `content`."""
+        parts = [self.segments[0]]
+        for key, segment in zip(self.keys, self.segments[1:]):
+            parts.append(
+                str(content[key]) if key in content else f"{{{{ {key} }}}}"
+            )
+            parts.append(segment)
+        return "".join(parts)
+
+
+class TemplateRegistry:
+    """Registro de templates de `directory`, lidos e compilados uma única vez.
+
+    Com `reload` (modo DEBUG) o mtime do arquivo é verificado a cada uso e o
+    template é recompilado quando alterado.
+
+    Args:
+        directory (str): Diretório dos templates.
+        reload (bool): Recarregar templates alterados em disco.
+    """
+
+    def __init__(self, directory: str, reload: bool = False) -> None:
+        self.directory = directory
+        self.reload = reload
+        self._lock = threading.Lock()
+        self._templates: dict[str, tuple[float, Template]] = {}
+
+    def get(self, template_name: str) -> Template:
+        """Retorna o template compilado.
+
+        Raises:
+            FileNotFoundError: Template não encontrado em `directory`.
+        """
+        entry = self._templates.get(template_name)
+        if entry is not None and not self.reload:
+            return entry[1]
+        path = os.path.join(self.directory, template_name)
+        mtime = os.stat(path).st_mtime
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        with open(path, "r", encoding="utf-8") as file:
+            template = Template(file.read())
+        with self._lock:
+            self._templates[template_name] = (mtime, template)
+        return template
+
+    def render(self, template_name: str, content: dict) -> str:
+        return self.get(template_name).render(content)
+
+    def render_many(
+        self, template_name: str, contents: Iterable[dict]
+    ) -> list[str]:
+        """Renderiza o template para cada item de `contents` (ex.: um por destinatário)."""
+        template = self.get(template_name)
+        return [template.render(content) for content in contents]
+
+
+@functools.cache
+def template_registry() -> TemplateRegistry:
+    """Registro de templates da aplicação, em `TEMPLATES_DIR`."""
+    return TemplateRegistry(
+        core.settings.TEMPLATES_DIR, reload=core.settings.DEBUG
+    )
 
 
 def template_string(template_name: str, content: dict) -> str:
@@ -18,22 +122,202 @@ def template_string(template_name: str, content: dict) -> str:
     Returns:
         str: Retorna uma string do template preenchida com o conteúdo.
     """
-    # Carrega o template do arquivo
-    template_path = f"{core.settings.TEMPLATES_DIR}/{template_name}"
-    try:
-        with open(template_path, "r", encoding="utf-8") as file:
-            template_content = file.read()
+    return render_many(template_name, [content])[0]
 
-        # Substitui as chaves no template pelos valores do dicionário 'content'
-        for key, value in content.items():
-            template_content = template_content.replace(f"{{{{ {key} }}}}", str(value))
 
-        return template_content
+def render_many(template_name: str, contents: Iterable[dict]) -> list[str]:
+    """Cria as strings do template para vários conteúdos, ex.: um por destinatário.
+
+    Args:
+        template_name (str): Nome do template a ser usado.
+        contents (Iterable[dict]): Conteúdos do template.
+
+    Returns:
+        list[str]: Templates preenchidos, na ordem de `contents`.
+    """
+    try:
+        return template_registry().render_many(template_name, contents)
     except FileNotFoundError:
         logging.error(f"Template {template_name} não encontrado em {core.settings.TEMPLATES_DIR}")
         raise FileNotFoundError("Template não encontrado")
 
 
+class SMTPPool:
+    """Pool de conexões SMTP autenticadas, reutilizadas entre envios.
+
+    Cada conexão faz EHLO, STARTTLS e LOGIN uma única vez. Conexões ociosas por mais
+    de `idle_seconds` são verificadas com NOOP antes do uso, e uma conexão derrubada
+    pelo servidor é refeita e o envio repetido uma vez.
+
+    Args:
+        host (str): Host do servidor SMTP.
+        port (int): Porta do servidor SMTP.
+        username (str | None): Usuário do LOGIN; sem ele a autenticação é ignorada.
+        password (str | None): Senha do LOGIN.
+        tls (bool): Utilizar STARTTLS.
+        size (int): Quantidade máxima de conexões simultâneas.
+        idle_seconds (float): Ociosidade após a qual a conexão é verificada.
+        timeout (float): Timeout das operações de rede.
+        sender (str | None): Remetente do envelope. Padrão: `username`.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        tls: bool = True,
+        size: int = 2,
+        idle_seconds: float = 60,
+        timeout: float = 5,
+        sender: str | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender or username
+        self.tls = tls
+        self.idle_seconds = idle_seconds
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: list[tuple[smtplib.SMTP, float]] = []
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.tls:
+                smtp.starttls()
+                smtp.ehlo()
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except BaseException:
+            self._discard(smtp)
+            raise
+        return smtp
+
+    @staticmethod
+    def _discard(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+    @staticmethod
+    def _alive(smtp: smtplib.SMTP) -> bool:
+        try:
+            return smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _acquire(self) -> smtplib.SMTP:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                smtp, last_used = self._idle.pop()
+            if time.monotonic() - last_used < self.idle_seconds:
+                return smtp
+            if self._alive(smtp):
+                return smtp
+            smtp.close()
+        return self._connect()
+
+    def _release(self, smtp: smtplib.SMTP) -> None:
+        with self._lock:
+            self._idle.append((smtp, time.monotonic()))
+
+    def _sendmail(self, smtp: smtplib.SMTP, receiver: str, message: str):
+        """Envia pela conexão, reconectando uma vez se o servidor a derrubou."""
+        try:
+            smtp.sendmail(self.sender, receiver, message)
+            return smtp
+        except smtplib.SMTPServerDisconnected:
+            smtp.close()
+            smtp = self._connect()
+            smtp.sendmail(self.sender, receiver, message)
+            return smtp
+
+    def send_many(self, messages: Iterable[tuple[str, str]]) -> dict:
+        """Envia várias mensagens pela mesma conexão autenticada.
+
+        O resultado é por mensagem: se a conexão cair no meio do lote, a mensagem em
+        envio e as seguintes são dadas como falhas, e as anteriores continuam
+        registradas como enviadas.
+
+        Args:
+            messages (Iterable[tuple[str, str]]): Pares (destinatário, mensagem MIME em texto).
+
+        Raises:
+            SMTPException: Se não for possível obter uma conexão; nada foi enviado.
+
+        Returns:
+            dict: Índice de cada mensagem não enviada e o respectivo erro.
+        """
+        messages = list(messages)
+        failures = {}
+        with self._slots:
+            smtp = self._acquire()
+            reusable = False
+            try:
+                for index, (receiver, message) in enumerate(messages):
+                    try:
+                        smtp = self._sendmail(smtp, receiver, message)
+                    except (
+                        smtplib.SMTPRecipientsRefused,
+                        smtplib.SMTPDataError,
+                    ) as e:
+                        failures[index] = e
+                    except (smtplib.SMTPException, OSError) as e:
+                        failures.update(
+                            dict.fromkeys(range(index, len(messages)), e)
+                        )
+                        return failures
+                reusable = True
+            finally:
+                # Após um erro no meio da transação o estado da conexão é incerto
+                if reusable:
+                    self._release(smtp)
+                else:
+                    smtp.close()
+        return failures
+
+    def close(self) -> None:
+        """Encerra as conexões ociosas do pool."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            self._discard(smtp)
+
+
+@functools.cache
+def smtp_pool() -> SMTPPool:
+    """Pool SMTP da aplicação, configurado por `Settings`."""
+    return SMTPPool(
+        host=core.settings.SMTP_HOST,
+        port=core.settings.SMTP_PORT,
+        username=core.settings.EMAILS_FROM_EMAIL,
+        password=core.settings.SMTP_PASSWORD,
+        sender=core.settings.EMAILS_FROM_EMAIL,
+        tls=core.settings.SMTP_TLS is not False,
+        size=core.settings.SMTP_POOL_SIZE,
+        idle_seconds=core.settings.SMTP_IDLE_SECONDS,
+    )
+
+
+def build_message(email_receiver: str, subject: str, body: str) -> str:
+    """Monta a mensagem MIME (HTML) de um email, pronta para `sendmail`."""
+    em = MIMEMultipart()
+    em.attach(MIMEText(body, "html"))
+    em["From"] = core.settings.EMAILS_FROM_EMAIL
+    em["Subject"] = subject
+    em["To"] = email_receiver
+    return em.as_string()
+
+
 def send_email(email_receiver: str, subject: str, body: str) -> None:
     """Envio de email.
 
@@ -46,26 +330,33 @@ def send_email(email_receiver: str, subject: str, body: str) -> None:
         CustomException: Caso não seja possível enviar, gera um erro.
     """
     try:
-        em = MIMEMultipart()
-        em.attach(MIMEText(body, "html"))
-        em["From"] = core.settings.EMAILS_FROM_EMAIL
-        em["Subject"] = subject
-        em["To"] = email_receiver
-
-        with smtplib.SMTP(
-            "smtp.gmail.com", core.settings.SMTP_PORT, timeout=5
-        ) as smtp:
-            smtp.ehlo()
-            smtp.starttls()
-            smtp.login(
-                core.settings.EMAILS_FROM_EMAIL, core.settings.SMTP_PASSWORD
-            )
-            smtp.sendmail(
-                core.settings.EMAILS_FROM_EMAIL,
-                email_receiver,
-                em.as_string(),
-            )
-    except smtplib.SMTPException as e:
+        failures = smtp_pool().send_many(
+            [(email_receiver, build_message(email_receiver, subject, body))]
+        )
+        if failures:
+            raise failures[0]
+    except (smtplib.SMTPException, OSError) as e:
         logging.error(f"Falha ao enviar email: {e}")
         raise error.custom_HTTPException("Erro ao enviar o email")
 
+
+def send_many(emails: Iterable[tuple[str, str, str]]) -> dict:
+    """Envio de vários emails por uma única conexão SMTP autenticada.
+
+    Args:
+        emails (Iterable[tuple[str, str, str]]): Tuplas (destinatário, título, conteúdo).
+
+    Raises:
+        CustomException: Caso não seja possível conectar ao servidor.
+
+    Returns:
+        dict: Índice (na ordem de `emails`) de cada email não enviado e o respectivo erro.
+    """
+    try:
+        return smtp_pool().send_many(
+            (receiver, build_message(receiver, subject, body))
+            for receiver, subject, body in emails
+        )
+    except (smtplib.SMTPException, OSError) as e:
+        logging.error(f"Falha ao enviar emails: {e}")
+        raise error.custom_HTTPException("Erro ao enviar o email")
@@ -1,11 +1,12 @@
 import csv
+import inspect
 import os
 import random
 import re
 import string
 import uuid
-from datetime import datetime
-from io import BytesIO
+from datetime import date, datetime, time
+from typing import Iterable
 
 import magic
 from faker import Faker
@@ -17,6 +18,11 @@ __all__ = [
     "save_file",
     "delete_file",
     "save_csv_file",
+    "save_csv_stream",
+    "save_parquet_stream",
+    "arrow_type",
+    "arrow_table",
+    "format_count",
     "list_files",
     "generate_code",
     "camel_to_kebab",
@@ -102,6 +108,29 @@ def pascal_to_kebab_case(string):
     return kebab.lstrip("-")
 
 
+def format_count(value: int | None, approximate: bool = False) -> str:
+    """Formata uma contagem para exibição.
+
+    Contagens exatas usam separador de milhar (ex.: "1.234.567"); aproximadas são
+    abreviadas e prefixadas com "~" (ex.: "~1.2M").
+
+    Args:
+        value (int | None): Contagem.
+        approximate (bool): Se a contagem é uma estimativa.
+
+    Returns:
+        str: Contagem formatada, ou "-" se ausente.
+    """
+    if value is None:
+        return "-"
+    if not approximate:
+        return f"{value:,}".replace(",", ".")
+    for limit, suffix in ((10**9, "B"), (10**6, "M"), (10**3, "K")):
+        if abs(value) >= limit:
+            return f"~{value / limit:.1f}".rstrip("0").rstrip(".") + suffix
+    return f"~{value}"
+
+
 def camel_to_kebab(camel_str):
     """
     Converte uma string em notação CamelCase para kebab-case.
@@ -152,13 +181,34 @@ def camel_to_snake_case(camel_str):
     return kebab_str
 
 
-async def save_file(path: str, file: bytes, type: str) -> str:
+# Bytes lidos do início do arquivo para identificar o tipo com o libmagic
+SNIFF_SIZE = 8192
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def _read_chunk(file, size: int) -> bytes:
+    """Lê até `size` bytes de um upload síncrono ou assíncrono (`UploadFile`)."""
+    data = file.read(size)
+    if inspect.isawaitable(data):
+        data = await data
+    return data
+
+
+async def save_file(
+    path: str, file, type: str, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> str:
     """Salva arquivos
 
+    O arquivo é lido em blocos: o tipo é identificado pelos primeiros `SNIFF_SIZE`
+    bytes, os blocos são gravados em um arquivo temporário no próprio `path` e, ao
+    final, renomeados atomicamente. A memória usada fica limitada a `chunk_size`,
+    e um upload interrompido não deixa arquivo parcial.
+
     Args:
         path (str): Diretorio onde sera salvo o arquivo
-        file (UploadFile): fastapi file upload
+        file (UploadFile): fastapi file upload ou arquivo com `read(size)`
         type (str): tipo do file obs: 'video' , 'image' ...
+        chunk_size (int): bytes lidos por bloco.
 
     Raises:
         CustomException: 400 Arquivo ou diretorio não encontrado
@@ -172,16 +222,28 @@ async def save_file(path: str, file: bytes, type: str) -> str:
             status_code=400,
             detail="Arquivo ou diretorio não encontrado",
         )
-    w_file = BytesIO()
-    w_file.write(await file.read())
-    w_file.seek(0)
-    if str(magic.from_buffer(w_file.read(), True)).split("/")[0] != type:
+    head = b""
+    while len(head) < SNIFF_SIZE:
+        chunk = await _read_chunk(file, SNIFF_SIZE - len(head))
+        if not chunk:
+            break
+        head += chunk
+    if str(magic.from_buffer(head, True)).split("/")[0] != type:
         raise error.CustomException(422, "Formato de media invalido")
-    w_file.seek(0)
     name = str(uuid.uuid4())
-    filename = os.path.join(path, name)
-    with open(filename, "wb") as f:
-        f.write(w_file.getbuffer())
+    temp = os.path.join(path, f".upload-{name}")
+    # O_EXCL não reaproveita um arquivo existente; o kernel aplica a umask ao 0o666
+    fd = os.open(temp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(head)
+            while chunk := await _read_chunk(file, chunk_size):
+                f.write(chunk)
+        os.replace(temp, os.path.join(path, name))
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
     return name
 
 
@@ -216,6 +278,148 @@ def save_csv_file(path: str, header: list, data: list) -> str:
     return name
 
 
+def save_csv_stream(path: str, header: list, chunks: Iterable) -> str:
+    """Salva arquivos CSV a partir de blocos de linhas.
+
+    Cada bloco é escrito assim que recebido, então a memória usada depende do
+    tamanho do bloco e não do total de linhas.
+
+    Args:
+        path (str): Diretorio onde sera salvo o arquivo
+        header (list): cabeçalho das colunas.
+        chunks (Iterable): blocos (listas) de linhas.
+
+    Returns:
+        str: retorna o nome do arquivo que a que foi salvo.
+    Raises:
+        FileNotFoundError: Arquivo ou diretorio nao encontrado
+    """
+    name = str(uuid.uuid4())
+    filename = f"{path}{name}"
+    try:
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for chunk in chunks:
+                writer.writerows(chunk)
+    except FileNotFoundError:
+        raise error.CustomException(404, "Arquivo ou diretorio não encontrado")
+    return name
+
+
+def arrow_type(python_type: type):
+    """Retorna o tipo pyarrow correspondente a um tipo Python, se conhecido."""
+    import pyarrow as pa
+
+    return {
+        str: pa.string(),
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+        bytes: pa.binary(),
+        datetime: pa.timestamp("us"),
+        date: pa.date32(),
+        time: pa.time64("us"),
+        uuid.UUID: pa.string(),
+    }.get(python_type)
+
+
+def _arrow_array(values: Iterable, python_type: type | None = None):
+    """Converte os valores de uma coluna em um array pyarrow tipado."""
+    import pyarrow as pa
+
+    return pa.array(
+        [str(v) if isinstance(v, uuid.UUID) else v for v in values],
+        type=arrow_type(python_type),
+    )
+
+
+def arrow_table(header: list, chunks: Iterable, types: dict | None = None):
+    """Monta uma tabela pyarrow colunar a partir de blocos de linhas.
+
+    Cada bloco é convertido em arrays tipados assim que lido, e a tabela final é
+    formada por `ChunkedArray`s sem copiar os dados novamente. Pode ser entregue
+    diretamente a `st.dataframe`, que já serializa em Arrow.
+
+    Args:
+        header (list): nome das colunas.
+        chunks (Iterable): blocos (listas) de linhas, ex.: `Result.partitions()`.
+        types (dict | None): tipo Python de cada coluna.
+
+    Returns:
+        pyarrow.Table: Tabela com uma coluna por item de `header`.
+    """
+    import pyarrow as pa
+
+    types = types or {}
+    arrays = {key: [] for key in header}
+    for chunk in chunks:
+        for key, column in zip(header, zip(*chunk)):
+            arrays[key].append(_arrow_array(column, types.get(key)))
+    columns = {}
+    for key, parts in arrays.items():
+        typed = [part.type for part in parts if part.type != pa.null()]
+        target = (typed or [arrow_type(types.get(key)) or pa.null()])[0]
+        columns[key] = pa.chunked_array(
+            [part.cast(target) for part in parts], type=target
+        )
+    return pa.table(columns)
+
+
+def save_parquet_stream(
+    path: str, header: list, chunks: Iterable, types: dict | None = None
+) -> str:
+    """Salva arquivos Parquet a partir de blocos de linhas.
+
+    Cada bloco vira um row group do arquivo. As colunas sem tipo informado em
+    `types` têm o tipo inferido do primeiro bloco; UUIDs são gravados como texto.
+
+    Args:
+        path (str): Diretorio onde sera salvo o arquivo
+        header (list): nome das colunas.
+        chunks (Iterable): blocos (listas) de linhas.
+        types (dict | None): tipo Python de cada coluna.
+
+    Returns:
+        str: retorna o nome do arquivo que a que foi salvo.
+    Raises:
+        FileNotFoundError: Arquivo ou diretorio nao encontrado
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = types or {}
+    name = str(uuid.uuid4())
+    filename = f"{path}{name}"
+    writer = None
+    try:
+        for chunk in chunks:
+            columns = zip(*chunk) if chunk else [[] for _ in header]
+            table = pa.table(
+                {
+                    key: _arrow_array(column, types.get(key))
+                    for key, column in zip(header, columns)
+                }
+            )
+            if writer is None:
+                writer = pq.ParquetWriter(filename, table.schema)
+            writer.write_table(table.cast(writer.schema))
+        if writer is None:
+            schema = pa.schema(
+                [
+                    (key, arrow_type(types.get(key)) or pa.string())
+                    for key in header
+                ]
+            )
+            pq.write_table(schema.empty_table(), filename)
+    except FileNotFoundError:
+        raise error.CustomException(404, "Arquivo ou diretorio não encontrado")
+    finally:
+        if writer is not None:
+            writer.close()
+    return name
+
+
 def delete_file(path: str, filename: str) -> bool:
     """Exclui um arquivo atraves de seu caminho e nome
 
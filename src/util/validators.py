@@ -2,6 +2,7 @@ import re
 from itertools import cycle
 
 from email_validator import EmailNotValidError, validate_email
+from pydantic import ValidationInfo
 
 import core, error
 
@@ -100,9 +101,12 @@ def normalize_uper(key: str):
     return " ".join((word.upper()) for word in key.split(" "))
 
 
-def normalize_password(key: bytes):
+def normalize_password(key: bytes, info: ValidationInfo):
     if not key:
         return key
+    # lotes já têm as senhas transformadas em hash em paralelo (PostUser.validate_many)
+    if (info.context or {}).get("password_hashed"):
+        return key
     return core.get_password_hash(key)
 
 
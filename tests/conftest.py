@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+# Banco SQLite descartável; as variáveis precisam existir antes de importar `core`
+_DB_DIR = tempfile.mkdtemp(prefix="tests-")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DEBUG", "true")
+os.environ.setdefault(
+    "SQLALCHEMY_DATABASE_URI", f"sqlite:///{_DB_DIR}/test.db"
+)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import db  # noqa: E402
+import models  # noqa: E402
+import util  # noqa: E402
+from db.base_class import Base  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    Base.metadata.create_all(db.engine)
+    yield
+    Base.metadata.drop_all(db.engine)
+    db.engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clean_tables():
+    yield
+    with db.engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    util.invalidate_cache(
+        *(table.name for table in Base.metadata.sorted_tables)
+    )
+
+
+def user_data(index: int) -> dict:
+    return {
+        "uuid": uuid.uuid4(),
+        "username": f"user{index:02d}",
+        "email": f"user{index:02d}@empresa.com",
+        "password": b"x",
+    }
+
+
+@pytest.fixture
+def users():
+    """25 usuários criados em ordem, para paginação e filtros."""
+    return models.User.bulk_create([user_data(i) for i in range(25)])
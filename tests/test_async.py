@@ -0,0 +1,31 @@
+import asyncio
+
+import db
+import models
+
+
+def test_async_calls_reuse_the_pool_across_event_loops(users):
+    async def count():
+        return await models.User.count_async()
+
+    # Cada `asyncio.run` cria um loop novo, como cada execução do Streamlit
+    counts = [asyncio.run(count()) for _ in range(3)]
+    counts.append(db.run_async(models.User.count_async()))
+
+    pool = db.async_engine().pool
+    assert counts == [25] * 4
+    assert pool.checkedin() == 1
+    assert pool.checkedout() == 0
+
+
+def test_async_write_runs_on_the_background_loop(users):
+    user = models.User.get(attribute="username", value="user00")
+
+    updated = asyncio.run(
+        models.User.update_async(user.uuid, email="novo@empresa.com")
+    )
+
+    assert updated.email == "novo@empresa.com"
+    assert models.User.get(attribute="username", value="user00").email == (
+        "novo@empresa.com"
+    )
@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy import event
+
+import db
+import error
+import models
+from conftest import user_data
+
+
+def test_bulk_create_batches():
+    inserts = []
+
+    def count_inserts(conn, cursor, statement, params, context, executemany):
+        if statement.startswith("INSERT"):
+            inserts.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count_inserts)
+    try:
+        created = models.User.bulk_create(
+            [user_data(i) for i in range(7)], batch_size=3
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count_inserts)
+
+    assert len(created) == 7
+    # Um comando por lote
+    assert len(inserts) == 3
+    assert models.User.count() == 7
+
+
+def test_bulk_create_rolls_back_failed_batch():
+    first = [user_data(i) for i in range(3)]
+    duplicated = [
+        user_data(3),
+        dict(user_data(4), uuid=first[0]["uuid"]),
+        user_data(5),
+    ]
+    last = [user_data(6)]
+
+    with pytest.raises(error.CustomException) as exc:
+        models.User.bulk_create(first + duplicated + last, batch_size=3)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail["processed"] == 4
+    assert [e["batch"] for e in exc.value.detail["errors"]] == [1]
+    # Apenas o lote com a chave duplicada foi desfeito
+    assert models.User.count() == 4
+
+
+def test_bulk_update_and_remove(users):
+    uuids = [user.uuid for user in users]
+
+    updated = models.User.bulk_update(
+        uuids=uuids[:10], values={"active": False}, batch_size=4
+    )
+    assert updated == 10
+    assert models.User.count("active", False) == 10
+
+    updated = models.User.bulk_update(
+        data=[{"uuid": uuids[0], "username": "renomeado"}]
+    )
+    assert updated == 1
+    assert models.User.get("uuid", uuids[0]).username == "renomeado"
+
+    removed = models.User.bulk_remove(uuids[:15], batch_size=4)
+    assert removed == 15
+    assert models.User.count() == 10
+
+
+def test_bulk_update_requires_uuid():
+    with pytest.raises(error.CustomException) as exc:
+        models.User.bulk_update(data=[{"username": "x"}])
+    assert exc.value.status_code == 422
+
+
+def test_bulk_invalidates_cache_after_unexpected_error(users, monkeypatch):
+    cache = db.base_class.util.get_cache(models.User.__tablename__)
+    cache.set("listagem", "antiga")
+
+    def explode(batch):
+        raise RuntimeError("falha inesperada")
+
+    monkeypatch.setattr(
+        db.base_class,
+        "_run_batches",
+        lambda _db, owned, items, size, execute: explode(items),
+    )
+    with pytest.raises(error.CustomException):
+        models.User.bulk_remove([users[0].uuid])
+
+    assert cache.get("listagem") is None
+
+
+def test_bulk_in_unit_of_work_defers_invalidation(users):
+    cache = db.base_class.util.get_cache(models.User.__tablename__)
+    with db.unit_of_work():
+        models.User.bulk_remove([users[0].uuid])
+        cache.set("listagem", "antiga")
+        assert cache.get("listagem") == "antiga"
+
+    assert cache.get("listagem") is None
+    assert models.User.count() == 24
@@ -0,0 +1,27 @@
+import models
+from conftest import user_data
+from db.counts import (
+    count_generation,
+    invalidate_counts,
+    lookup_count,
+    store_count,
+)
+
+
+def test_count_computed_before_a_write_is_not_cached():
+    generation = count_generation(models.User)
+    # Escrita concluída enquanto a contagem ainda estava em andamento
+    invalidate_counts(models.User.__tablename__)
+
+    assert store_count(models.User, 10, generation) == 10
+    assert lookup_count(models.User) is None
+
+
+def test_cached_total_is_invalidated_by_model_writes(users):
+    page = models.User.query_params(limit=5, skip=0, count_mode="cached")
+    assert page.meta["total_data"] == 25
+    assert lookup_count(models.User) == 25
+
+    models.User.bulk_create([user_data(99)])
+
+    assert lookup_count(models.User) is None
@@ -0,0 +1,114 @@
+import smtplib
+import socket
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from util.email import SMTPPool
+
+REFUSED = "recusado@empresa.com"
+
+
+class Handler:
+    def __init__(self) -> None:
+        self.received: list[tuple[str, ...]] = []
+
+    async def handle_RCPT(self, server, session, envelope, address, options):
+        if address == REFUSED:
+            return "550 Caixa inexistente"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received.append(tuple(envelope.rcpt_tos))
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = Handler()
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+@pytest.fixture
+def pool(smtp_server):
+    controller, _ = smtp_server
+    pool = SMTPPool(
+        controller.hostname,
+        controller.port,
+        tls=False,
+        size=1,
+        sender="sistema@empresa.com",
+    )
+    connects = []
+    connect = pool._connect
+
+    def counted_connect():
+        connects.append(connect())
+        return connects[-1]
+
+    pool._connect = counted_connect
+    pool.connects = connects
+    yield pool
+    pool.close()
+
+
+def test_refused_recipient_is_reported_by_index(pool, smtp_server):
+    _, handler = smtp_server
+
+    failures = pool.send_many(
+        [
+            ("a@empresa.com", "mensagem 1"),
+            (REFUSED, "mensagem 2"),
+            ("a@empresa.com", "mensagem 3"),
+        ]
+    )
+
+    assert list(failures) == [1]
+    assert isinstance(failures[1], smtplib.SMTPRecipientsRefused)
+    assert handler.received == [("a@empresa.com",), ("a@empresa.com",)]
+    assert len(pool.connects) == 1
+    assert len(pool._idle) == 1
+
+
+def test_connection_is_reused_between_batches(pool, smtp_server):
+    _, handler = smtp_server
+
+    assert pool.send_many([("a@empresa.com", "mensagem 1")]) == {}
+    assert pool.send_many([("b@empresa.com", "mensagem 2")]) == {}
+
+    assert len(handler.received) == 2
+    assert len(pool.connects) == 1
+
+
+def test_dropped_connection_is_reconnected(pool, smtp_server):
+    _, handler = smtp_server
+    pool.send_many([("a@empresa.com", "mensagem 1")])
+
+    # Conexão derrubada enquanto estava ociosa no pool
+    pool._idle[0][0].sock.shutdown(socket.SHUT_RDWR)
+    failures = pool.send_many([("b@empresa.com", "mensagem 2")])
+
+    assert failures == {}
+    assert handler.received[-1] == ("b@empresa.com",)
+    assert len(pool.connects) == 2
+    assert len(pool._idle) == 1
+
+
+def test_unexpected_error_closes_the_connection(pool):
+    with pytest.raises(TypeError):
+        pool.send_many([("a@empresa.com", None)])
+
+    assert pool.connects[0].sock is None
+    assert pool._idle == []
+    # O slot foi devolvido: um novo envio não fica bloqueado
+    assert pool.send_many([("a@empresa.com", "mensagem")]) == {}
@@ -0,0 +1,54 @@
+import logging
+
+import pytest
+from sqlalchemy import inspect
+
+import core
+import db
+import models
+from services import bootstrap, email_outbox
+
+TABLE = models.EmailOutbox.__table__
+
+
+@pytest.fixture
+def without_outbox_table():
+    TABLE.drop(db.engine)
+    yield
+    TABLE.create(db.engine, checkfirst=True)
+
+
+def test_bootstrap_does_not_start_the_worker_without_smtp(monkeypatch):
+    started = []
+    monkeypatch.setattr(core.settings, "SMTP_HOST", None)
+    monkeypatch.setattr(
+        email_outbox, "start_worker", lambda: started.append(1)
+    )
+
+    bootstrap.start()
+
+    assert started == []
+
+
+def test_bootstrap_creates_the_outbox_table(monkeypatch, without_outbox_table):
+    started = []
+    monkeypatch.setattr(core.settings, "SMTP_HOST", "localhost")
+    monkeypatch.setattr(
+        email_outbox, "start_worker", lambda: started.append(1)
+    )
+
+    bootstrap.start()
+
+    assert inspect(db.engine).has_table(TABLE.name)
+    assert started == [1]
+
+
+def test_worker_stops_when_the_table_is_missing(caplog, without_outbox_table):
+    worker = email_outbox.OutboxWorker()
+
+    with caplog.at_level(logging.ERROR):
+        worker.run()
+
+    assert [record.message for record in caplog.records] == [
+        "Tabela 'email_outbox' não existe; worker da fila de emails encerrado."
+    ]
@@ -0,0 +1,36 @@
+import asyncio
+import io
+import os
+import stat
+
+import pytest
+
+import error
+import util
+
+# Cabeçalho mínimo de um PNG, suficiente para o libmagic
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"\x00" * 64
+
+
+def test_save_file_applies_the_umask(tmp_path):
+    previous = os.umask(0o027)
+    try:
+        name = asyncio.run(
+            util.save_file(str(tmp_path), io.BytesIO(PNG), "image")
+        )
+    finally:
+        os.umask(previous)
+
+    assert os.listdir(tmp_path) == [name]
+    mode = stat.S_IMODE(os.stat(tmp_path / name).st_mode)
+    assert mode == 0o640
+    assert (tmp_path / name).read_bytes() == PNG
+
+
+def test_save_file_rejects_other_types_without_leaving_files(tmp_path):
+    with pytest.raises(error.CustomException):
+        asyncio.run(
+            util.save_file(str(tmp_path), io.BytesIO(b"texto"), "image")
+        )
+
+    assert os.listdir(tmp_path) == []
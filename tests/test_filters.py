@@ -0,0 +1,125 @@
+import pytest
+
+import error
+import models
+import util
+from db.filters import compile_tree
+
+
+@pytest.mark.parametrize(
+    "tree",
+    [
+        {"field": "username", "op": "~", "value": "ana"},
+        {"not": {"field": "email", "op": "null", "value": True}},
+        {
+            "and": [
+                {"field": "email", "op": "~", "value": "@empresa.com"},
+                {
+                    "or": [
+                        {"field": "username", "op": "in", "value": ["a"]},
+                        {"field": "username", "op": "=", "value": "b"},
+                    ]
+                },
+            ]
+        },
+    ],
+)
+def test_parse_filter_tree_valid(tree):
+    assert util.parse_filter_tree(tree) is tree
+
+
+@pytest.mark.parametrize(
+    "tree",
+    [
+        [{"field": "username"}],
+        {"xor": [{"field": "username", "value": "a"}]},
+        {"and": []},
+        {"or": {"field": "username", "value": "a"}},
+        {"and": [{"field": "username"}], "or": [{"field": "email"}]},
+        {"field": "username", "op": "^", "value": "a"},
+        {"field": "username", "op": "in", "value": "a,b"},
+        {"field": 1, "value": "a"},
+    ],
+)
+def test_parse_filter_tree_invalid(tree):
+    with pytest.raises(ValueError):
+        util.parse_filter_tree(tree)
+    with pytest.raises(error.CustomException) as exc:
+        compile_tree(models.User, tree)
+    assert exc.value.status_code == 422
+
+
+def test_query_parameters_filters_json():
+    params = util.QueryParameters(
+        filters='{"or": [{"field": "username", "op": "=", "value": "a"}]}'
+    )
+    assert params.filters == {
+        "or": [{"field": "username", "op": "=", "value": "a"}]
+    }
+    with pytest.raises(ValueError):
+        util.QueryParameters(filters="{nao e json")
+
+
+def test_compile_tree_unknown_field():
+    with pytest.raises(error.CustomException) as exc:
+        compile_tree(models.User, {"field": "nope", "value": "a"})
+    assert exc.value.status_code == 404
+
+
+def test_query_params_filter_tree(users):
+    page = models.User.query_params(
+        all_data=True,
+        filters={
+            "and": [
+                {"field": "email", "op": "~", "value": "@empresa.com"},
+                {
+                    "or": [
+                        {
+                            "field": "username",
+                            "op": "in",
+                            "value": ["user01", "user02"],
+                        },
+                        {
+                            "not": {
+                                "field": "username",
+                                "op": "<",
+                                "value": "user24",
+                            }
+                        },
+                    ]
+                },
+            ]
+        },
+    )
+
+    assert sorted(user.username for user in page.data) == [
+        "user01",
+        "user02",
+        "user24",
+    ]
+
+
+@pytest.mark.parametrize("value", ["yes", "abc", ""])
+def test_bool_filter_rejects_unknown_values(users, value):
+    with pytest.raises(error.CustomException) as exc:
+        models.User.query_params(
+            all_data=True, attribute="active", value=value
+        )
+    assert exc.value.status_code == 422
+    with pytest.raises(error.CustomException) as exc:
+        compile_tree(
+            models.User, {"field": "email", "op": "null", "value": value}
+        )
+    assert exc.value.status_code == 422
+
+
+def test_bool_filter_values(users):
+    models.User.bulk_update(
+        uuids=[user.uuid for user in users[:5]], values={"active": False}
+    )
+
+    for value, expected in (("false", 5), ("0", 5), ("true", 20), ("1", 20)):
+        page = models.User.query_params(
+            all_data=True, attribute="active", value=value
+        )
+        assert len(page.data) == expected
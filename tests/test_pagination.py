@@ -0,0 +1,108 @@
+import pytest
+
+import error
+import models
+
+
+def _names(response) -> list:
+    return [user.username for user in response.data]
+
+
+def _keyset_order() -> list:
+    """Todos os usuários na ordem do cursor, `(created_at, uuid)`."""
+    return _names(
+        models.User.query_params(all_data=True, keyset=True, limit=100)
+    )
+
+
+def test_keyset_first_page(users):
+    page = models.User.query_params(all_data=True, keyset=True, limit=10)
+
+    assert _names(page) == _keyset_order()[:10]
+    assert page.meta["prev_cursor"] is None
+    assert page.meta["next_cursor"] is not None
+
+
+def test_keyset_next_until_last_page(users):
+    pages = [models.User.query_params(all_data=True, keyset=True, limit=10)]
+    while pages[-1].meta["next_cursor"]:
+        pages.append(
+            models.User.query_params(
+                all_data=True, limit=10, cursor=pages[-1].meta["next_cursor"]
+            )
+        )
+
+    assert [len(page.data) for page in pages] == [10, 10, 5]
+    assert sum((_names(page) for page in pages), []) == _keyset_order()
+    assert len(set(_keyset_order())) == 25
+    assert pages[-1].meta["prev_cursor"] is not None
+
+
+def test_keyset_prev_round_trip(users):
+    first = models.User.query_params(all_data=True, keyset=True, limit=10)
+    second = models.User.query_params(
+        all_data=True, limit=10, cursor=first.meta["next_cursor"]
+    )
+    third = models.User.query_params(
+        all_data=True, limit=10, cursor=second.meta["next_cursor"]
+    )
+
+    back = models.User.query_params(
+        all_data=True, limit=10, cursor=third.meta["prev_cursor"]
+    )
+    assert _names(back) == _names(second)
+
+    start = models.User.query_params(
+        all_data=True, limit=10, cursor=back.meta["prev_cursor"]
+    )
+    assert _names(start) == _names(first)
+    assert start.meta["prev_cursor"] is None
+    assert start.meta["next_cursor"] is not None
+
+
+def test_keyset_invalid_cursor(users):
+    with pytest.raises(error.CustomException) as exc:
+        models.User.query_params(all_data=True, limit=10, cursor="invalido")
+    assert exc.value.status_code == 422
+
+
+def test_window_count_page(users):
+    page = models.User.query_params(
+        all_data=True,
+        attribute="username",
+        value="user1",
+        operator="~",
+        skip=0,
+        limit=5,
+        window_count=True,
+    )
+
+    assert len(page.data) == 5
+    assert page.meta["total_data"] == 25
+    assert page.meta["query_items"] == 10
+
+
+def test_window_count_empty_page_after_end(users):
+    page = models.User.query_params(
+        all_data=True,
+        attribute="username",
+        value="user1",
+        operator="~",
+        skip=5,
+        limit=5,
+        window_count=True,
+    )
+
+    assert page.data == []
+    assert page.meta["total_data"] == 25
+    assert page.meta["query_items"] == 10
+
+
+def test_window_count_empty_table():
+    page = models.User.query_params(
+        all_data=True, skip=0, limit=5, window_count=True
+    )
+
+    assert page.data == []
+    assert page.meta["total_data"] == 0
+    assert page.meta["query_items"] == 0
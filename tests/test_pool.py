@@ -0,0 +1,27 @@
+import sqlite3
+import time
+
+from db.pool import MeteredQueuePool
+
+
+def _slow_connect():
+    time.sleep(0.05)
+    return sqlite3.connect(":memory:")
+
+
+def test_connect_time_is_not_counted_as_wait():
+    pool = MeteredQueuePool(_slow_connect, pool_size=1, max_overflow=1)
+
+    first = pool.connect()
+    second = pool.connect()
+    first.close()
+    second.close()
+    third = pool.connect()
+    third.close()
+
+    metrics = pool.metrics()
+    assert metrics["checkouts"] == 3
+    assert metrics["connects"] == 2
+    assert metrics["connect_avg_ms"] >= 50
+    assert metrics["wait_max_ms"] < 50
+    assert metrics["timeouts"] == 0